@@ -1,8 +1,21 @@
 import os
 import uvicorn
-from eurosec_ai.main import app
 
 if __name__ == "__main__":
     host = os.getenv("EUROSEC_BACKEND_HOST", "127.0.0.1")
     port = int(os.getenv("EUROSEC_BACKEND_PORT", "48155"))
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    workers = int(os.getenv("EUROSEC_BACKEND_WORKERS", "1"))
+    uvicorn.run(
+        # import string (not the app object) so workers > 1 can fork
+        "eurosec_ai.main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        # "auto" picks uvloop where it's installed (not on Windows)
+        loop="auto",
+        http="httptools",
+        # long-running LLM responses: keep connections alive, shut down gently
+        timeout_keep_alive=int(os.getenv("EUROSEC_BACKEND_KEEPALIVE", "30")),
+        timeout_graceful_shutdown=int(os.getenv("EUROSEC_BACKEND_GRACEFUL_SHUTDOWN", "15")),
+        log_level="info",
+    )
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+import orjson
+
+from .openai_client import (
+    DEFAULT_MODEL,
+    OPENAI_BASE_URL,
+    OpenAIError,
+    _extract_text_from_responses,
+    _get_session,
+    _TIMEOUT,
+)
+
+# Batch jobs complete within 24h at half the token cost and without touching
+# the synchronous RPM budget — the right transport for non-interactive work
+# (bulk document enrichment, thesis evaluation runs).
+_COMPLETION_WINDOW = "24h"
+_POLL_SECONDS = float(os.getenv("EUROSEC_BATCH_POLL_SECONDS", "10"))
+
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _auth_headers(api_key: str) -> Dict[str, str]:
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+def _build_input_jsonl(prompts: List[str]) -> bytes:
+    """One request line per prompt, keyed by custom_id 'req-<index>'."""
+    lines: List[bytes] = []
+    for i, prompt in enumerate(prompts):
+        body = {
+            "model": DEFAULT_MODEL,
+            "input": [
+                {
+                    "role": "user",
+                    "content": [{"type": "input_text", "text": prompt}],
+                }
+            ],
+        }
+        lines.append(
+            orjson.dumps(
+                {
+                    "custom_id": f"req-{i}",
+                    "method": "POST",
+                    "url": "/v1/responses",
+                    "body": body,
+                }
+            )
+        )
+    return b"\n".join(lines) + b"\n"
+
+
+async def submit_batch(prompts: List[str]) -> Optional[str]:
+    """
+    Upload the prompts as a batch input file and create the batch job.
+    Returns the batch id, or None when cloud is unavailable (no API key)
+    or there is nothing to send.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key or not prompts:
+        return None
+
+    session = await _get_session()
+    headers = _auth_headers(api_key)
+
+    form = aiohttp.FormData()
+    form.add_field("purpose", "batch")
+    form.add_field(
+        "file",
+        _build_input_jsonl(prompts),
+        filename="batch_input.jsonl",
+        content_type="application/jsonl",
+    )
+    async with session.post(
+        f"{OPENAI_BASE_URL}/files", headers=headers, data=form, timeout=_TIMEOUT
+    ) as r:
+        if r.status >= 400:
+            raise OpenAIError(r.status, await r.text())
+        file_id = orjson.loads(await r.read())["id"]
+
+    payload = {
+        "input_file_id": file_id,
+        "endpoint": "/v1/responses",
+        "completion_window": _COMPLETION_WINDOW,
+    }
+    async with session.post(
+        f"{OPENAI_BASE_URL}/batches",
+        headers={**headers, "Content-Type": "application/json"},
+        data=orjson.dumps(payload),
+        timeout=_TIMEOUT,
+    ) as r:
+        if r.status >= 400:
+            raise OpenAIError(r.status, await r.text())
+        return orjson.loads(await r.read())["id"]
+
+
+async def wait_for_batch(
+    batch_id: str,
+    poll_seconds: Optional[float] = None,
+    max_wait_seconds: float = 24 * 3600,
+) -> Dict[str, str]:
+    """
+    Poll the batch until it reaches a terminal status, then download and parse
+    the output file. Returns custom_id -> extracted text for successful lines.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return {}
+
+    session = await _get_session()
+    headers = _auth_headers(api_key)
+    interval = poll_seconds if poll_seconds is not None else _POLL_SECONDS
+    deadline = time.monotonic() + max_wait_seconds
+
+    while True:
+        async with session.get(
+            f"{OPENAI_BASE_URL}/batches/{batch_id}", headers=headers, timeout=_TIMEOUT
+        ) as r:
+            if r.status >= 400:
+                raise OpenAIError(r.status, await r.text())
+            data = orjson.loads(await r.read())
+
+        status = data.get("status")
+        if status in _TERMINAL_STATUSES:
+            break
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"batch {batch_id} still {status} after {max_wait_seconds}s")
+        await asyncio.sleep(interval)
+
+    if status != "completed":
+        raise RuntimeError(f"batch {batch_id} ended as {status}")
+
+    output_file_id = data.get("output_file_id")
+    if not output_file_id:
+        return {}
+
+    async with session.get(
+        f"{OPENAI_BASE_URL}/files/{output_file_id}/content",
+        headers=headers,
+        timeout=_TIMEOUT,
+    ) as r:
+        if r.status >= 400:
+            raise OpenAIError(r.status, await r.text())
+        raw = await r.read()
+
+    results: Dict[str, str] = {}
+    for line in raw.splitlines():
+        if not line.strip():
+            continue
+        row = orjson.loads(line)
+        resp = row.get("response") or {}
+        if resp.get("status_code") == 200:
+            text = _extract_text_from_responses(resp.get("body") or {})
+            if text:
+                results[row.get("custom_id", "")] = text
+    return results
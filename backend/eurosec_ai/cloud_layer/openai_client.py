@@ -1,14 +1,55 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass
 from typing import Optional
 
-import httpx
+import aiohttp
+import orjson
 
 OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
 DEFAULT_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
 
+# Shared session: one TLS/TCP handshake per host, reused across requests.
+_session: Optional[aiohttp.ClientSession] = None
+_session_lock = asyncio.Lock()
+
+# Long generations: no total timeout, but bound connect + per-read.
+_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=120)
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        async with _session_lock:
+            if _session is None or _session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=40,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                )
+                _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session (call on app shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+class OpenAIError(RuntimeError):
+    """HTTP-level error from the OpenAI API; status is kept for retry logic."""
+
+    def __init__(self, status: int, body: str):
+        super().__init__(f"OpenAI error {status}: {body}")
+        self.status = status
+
+
 @dataclass(frozen=True)
 class CloudResult:
     text: str
@@ -54,15 +95,19 @@ async def ask_openai_sanitized(prompt: str) -> Optional[CloudResult]:
         ],
     }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        r = await client.post(f"{OPENAI_BASE_URL}/responses", headers=headers, json=payload)
-
-        if r.status_code >= 400:
+    session = await _get_session()
+    async with session.post(
+        f"{OPENAI_BASE_URL}/responses",
+        headers=headers,
+        data=orjson.dumps(payload),
+        timeout=_TIMEOUT,
+    ) as r:
+        if r.status >= 400:
             # Log this string to your evidence logs
-            err_body = r.text
-            raise RuntimeError(f"OpenAI error {r.status_code}: {err_body}")
+            err_body = await r.text()
+            raise OpenAIError(r.status, err_body)
 
-        data = r.json()
+        data = orjson.loads(await r.read())
 
     out_text = _extract_text_from_responses(data)
     return CloudResult(text=out_text if out_text else "(No text returned; check payload/model or log response JSON.)")
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """
+    Shared, minimal spaCy pipeline for sentence splitting.
+
+    summarizer.py and text_clean.py only ever use `.sents`, so a blank
+    English pipeline with a rule-based sentencizer is enough — no 40MB+
+    en_core_web_sm load, no tagger/parser/NER per document. Returns None
+    when spaCy is unavailable (callers fall back to regex splitting).
+    """
+    try:
+        import spacy  # type: ignore
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        return nlp
+    except Exception:
+        return None
@@ -1,10 +1,36 @@
 from __future__ import annotations
 
+import functools
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-import pandas as pd
+# Hoisted out of the hot function bodies; each is optional at runtime
+try:
+    from docx import Document  # python-docx
+except ImportError:
+    Document = None
+
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+try:
+    from pdfminer.high_level import extract_text as _pdfminer_extract_text
+except ImportError:
+    _pdfminer_extract_text = None
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
 
 
 @dataclass(frozen=True)
@@ -15,35 +41,79 @@ class ExtractedText:
 
 def extract_text(path_str: str, max_chars: int = 200_000) -> ExtractedText:
     p = Path(path_str).expanduser().resolve()
+
+    # Memoize on (path, mtime, size): users frequently re-ask about the same
+    # document. Edits invalidate automatically because mtime/size change.
+    try:
+        st = os.stat(p)
+        return _extract_cached(str(p), st.st_mtime_ns, st.st_size, max_chars)
+    except OSError:
+        return _extract_uncached(p, max_chars)
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_cached(path_str: str, mtime_ns: int, size: int, max_chars: int) -> ExtractedText:
+    return _extract_uncached(Path(path_str), max_chars)
+
+
+def _extract_uncached(p: Path, max_chars: int) -> ExtractedText:
     ext = p.suffix.lower()
 
     if ext == ".txt":
-        txt = p.read_text(encoding="utf-8", errors="ignore")
+        # Read only up to the budget (x4 bytes covers worst-case UTF-8 width)
+        with open(p, "rb") as f:
+            raw = f.read(max_chars * 4)
+        txt = raw.decode("utf-8", errors="ignore")
         return ExtractedText(text=txt[:max_chars], file_type="txt")
 
     if ext == ".docx":
-        from docx import Document  # python-docx
+        if Document is None:
+            return ExtractedText(text="", file_type="docx")
         doc = Document(str(p))
-        parts = [para.text for para in doc.paragraphs if para.text and para.text.strip()]
+        parts = []
+        total = 0
+        for para in doc.paragraphs:
+            if para.text and para.text.strip():
+                parts.append(para.text)
+                total += len(para.text) + 1
+                if total >= max_chars:
+                    break
         txt = "\n".join(parts)
         return ExtractedText(text=txt[:max_chars], file_type="docx")
 
     if ext == ".pdf":
-        # Prefer pdfminer.six, fallback to PyPDF2
-        txt = _extract_pdf_pdfminer(p)
+        # Prefer pypdfium2 (C-backed, much faster), then PyPDF2, then pdfminer.six
+        txt = _extract_pdf_pdfium(p, max_chars)
         if not txt.strip():
             txt = _extract_pdf_pypdf2(p)
+        if not txt.strip():
+            txt = _extract_pdf_pdfminer(p)
         return ExtractedText(text=txt[:max_chars], file_type="pdf")
 
     if ext in (".xlsx", ".xls"):
-        # Read as tables, convert to text rows
-        # openpyxl engine for xlsx
+        # Stream rows straight out of openpyxl (read_only) instead of
+        # materializing a DataFrame per sheet just to render it as text.
+        if load_workbook is None:
+            return ExtractedText(text="", file_type="xlsx")
         try:
-            xls = pd.ExcelFile(str(p))
+            wb = load_workbook(str(p), read_only=True, data_only=True)
             chunks = []
-            for sheet in xls.sheet_names[:5]:
-                df = xls.parse(sheet_name=sheet, nrows=200)
-                chunks.append(f"--- Sheet: {sheet} ---\n{df.to_string(index=False)}")
+            total = 0
+            for sheet in wb.sheetnames[:5]:
+                ws = wb[sheet]
+                rows = [f"--- Sheet: {sheet} ---"]
+                for ri, row in enumerate(ws.iter_rows(values_only=True)):
+                    if ri >= 200:
+                        break
+                    line = "\t".join("" if v is None else str(v) for v in row)
+                    rows.append(line)
+                    total += len(line) + 1
+                    if total >= max_chars:
+                        break
+                chunks.append("\n".join(rows))
+                if total >= max_chars:
+                    break
+            wb.close()
             txt = "\n\n".join(chunks)
         except Exception:
             txt = ""
@@ -52,17 +122,40 @@ def extract_text(path_str: str, max_chars: int = 200_000) -> ExtractedText:
     return ExtractedText(text="", file_type="unknown")
 
 
+def _extract_pdf_pdfium(p: Path, max_chars: int) -> str:
+    if pdfium is None:
+        return ""
+    try:
+        pdf = pdfium.PdfDocument(str(p))
+        try:
+            parts = []
+            total = 0
+            for i in range(min(len(pdf), 50)):
+                parts.append(pdf[i].get_textpage().get_text_bounded())
+                total += len(parts[-1])
+                # stop once the budget is hit; extra pages would be sliced off anyway
+                if total >= max_chars:
+                    break
+            return "\n".join(parts)
+        finally:
+            pdf.close()
+    except Exception:
+        return ""
+
+
 def _extract_pdf_pdfminer(p: Path) -> str:
+    if _pdfminer_extract_text is None:
+        return ""
     try:
-        from pdfminer.high_level import extract_text
-        return extract_text(str(p)) or ""
+        return _pdfminer_extract_text(str(p)) or ""
     except Exception:
         return ""
 
 
 def _extract_pdf_pypdf2(p: Path) -> str:
+    if PdfReader is None:
+        return ""
     try:
-        from PyPDF2 import PdfReader
         reader = PdfReader(str(p))
         out = []
         for page in reader.pages[:20]:
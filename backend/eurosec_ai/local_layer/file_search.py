@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 import os
+import queue
 import re
+import threading
+import time
 
 
 # Skip noisy directories that destroy relevance & performance
@@ -32,9 +36,14 @@ class FileHit:
     score: float
 
 
+# Precompiled once at module load (same style as _SMALLTALK_RE in pipeline.py)
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+_FILE_DIRECTIVE_RE = re.compile(r'\bfile\s*:\s*("([^"]+)"|(\S+))', re.IGNORECASE)
+
+
 def _tokenize(q: str) -> List[str]:
     q = (q or "").lower().strip()
-    return [t for t in re.split(r"[^a-z0-9]+", q) if len(t) >= 2]
+    return [t for t in _TOKEN_SPLIT_RE.split(q) if len(t) >= 2]
 
 
 def _extract_file_directive(q: str) -> Optional[str]:
@@ -47,19 +56,21 @@ def _extract_file_directive(q: str) -> Optional[str]:
     """
     if not q:
         return None
-    m = re.search(r'\bfile\s*:\s*("([^"]+)"|(\S+))', q, flags=re.IGNORECASE)
+    m = _FILE_DIRECTIVE_RE.search(q)
     if not m:
         return None
     return (m.group(2) or m.group(3) or "").strip() or None
 
 
-def _is_under_roots(path: str, allowed_roots: Iterable[str]) -> bool:
+def _normalize_roots(allowed_roots: Iterable[str]) -> List[str]:
+    return [os.path.abspath(r) for r in allowed_roots]
+
+
+def _is_under_roots(path: str, normalized_roots: List[str]) -> bool:
+    """Roots must already be normalized via _normalize_roots (no abspath here)."""
     p = os.path.abspath(path)
-    for r in allowed_roots:
-        rr = os.path.abspath(r)
-        if p == rr:
-            return True
-        if p.startswith(rr + os.sep):
+    for rr in normalized_roots:
+        if p == rr or p.startswith(rr + os.sep):
             return True
     return False
 
@@ -67,66 +78,191 @@ def _is_under_roots(path: str, allowed_roots: Iterable[str]) -> bool:
 def _walk_files(allowed_roots: List[str]) -> Iterable[str]:
     """
     Yields file paths under allowed_roots, pruning IGNORE_DIRS and hidden dirs.
+
+    Multiple roots (e.g. separate disks/mounts) are walked in parallel worker
+    threads; within a single root traversal stays sequential.
     """
-    for root in allowed_roots:
-        root = os.path.abspath(root)
-        if not os.path.isdir(root):
+    roots = [os.path.abspath(r) for r in allowed_roots if os.path.isdir(r)]
+    if len(roots) <= 1:
+        yield from _walk_one_root(roots)
+        return
+
+    # Unbounded on purpose: workers must never block on put(), otherwise an
+    # early-exiting consumer (e.g. exact-basename search) could deadlock the
+    # pool shutdown. Paths are cheap; the queue stays small in practice.
+    q: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    def _worker(root: str) -> None:
+        try:
+            for p in _walk_one_root([root]):
+                q.put(p)
+        finally:
+            q.put(None)  # sentinel: this root is done
+
+    workers = min(len(roots), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for r in roots:
+            ex.submit(_worker, r)
+        done = 0
+        while done < len(roots):
+            item = q.get()
+            if item is None:
+                done += 1
+            else:
+                yield item
+
+
+def _walk_one_root(roots: List[str]) -> Iterable[str]:
+    stack = list(roots)
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
             continue
-
-        for base, dirs, files in os.walk(root, topdown=True, followlinks=False):
-            # ✅ PRUNE DIRS IN-PLACE (the important part)
-            dirs[:] = [
-                d
-                for d in dirs
-                if d not in IGNORE_DIRS and not d.startswith(".")
-            ]
-
-            for fn in files:
-                # skip hidden files
-                if fn.startswith("."):
+        with it:
+            for e in it:
+                n = e.name
+                # skip hidden dirs/files
+                if n.startswith("."):
+                    continue
+                try:
+                    if e.is_dir(follow_symlinks=False):
+                        if n not in IGNORE_DIRS:
+                            stack.append(e.path)
+                        continue
+                    if not e.is_file(follow_symlinks=False):
+                        continue
+                except OSError:
                     continue
 
-                ext = os.path.splitext(fn)[1].lower()
+                ext = os.path.splitext(n)[1].lower()
                 if ext and ext not in ALLOWED_EXTS:
                     continue
 
-                yield os.path.join(base, fn)
+                yield e.path
 
 
-def _score_filename_match(tokens: List[str], filename: str) -> float:
+# camelCase boundary + subtoken split for index keys, so "invoiceReport.pdf"
+# is findable by "invoice" and "report"
+_CAMEL_SPLIT_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_SUBTOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _filename_subtokens(filename: str) -> Set[str]:
+    spaced = _CAMEL_SPLIT_RE.sub(" ", filename)
+    toks = {t for t in _SUBTOKEN_RE.findall(spaced.lower()) if len(t) >= 2}
+    # Also index the unsplit alphanumeric runs: a query token can match a
+    # substring that spans a camelCase boundary ("repo" in "xRepo"), which
+    # the split parts alone would miss under key-substring lookup.
+    toks.update(t for t in _SUBTOKEN_RE.findall(filename.lower()) if len(t) >= 2)
+    return toks
+
+
+class FileIndex:
     """
-    Simple scoring purely on filename.
+    Persistent in-process filename index for one set of allowed roots.
+
+    Walks the roots once, builds (sub-token -> file ids) posting lists plus a
+    basename lookup, and refreshes lazily when older than TTL_SECONDS, so
+    repeated searches are O(hits) instead of a fresh tree walk per request.
+    """
+
+    TTL_SECONDS = 60.0
+
+    def __init__(self, roots: Tuple[str, ...]):
+        self.roots = roots
+        self.paths: List[str] = []
+        self.basenames: Dict[str, List[int]] = {}  # lowercased basename -> ids
+        self.tokens: Dict[str, List[int]] = {}  # sub-token -> ids
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def refresh_if_stale(self) -> None:
+        if time.monotonic() - self._built_at < self.TTL_SECONDS:
+            return
+        with self._lock:
+            if time.monotonic() - self._built_at < self.TTL_SECONDS:
+                return
+            paths: List[str] = []
+            basenames: Dict[str, List[int]] = {}
+            tokens: Dict[str, List[int]] = {}
+            for p in _walk_files(list(self.roots)):
+                fid = len(paths)
+                paths.append(p)
+                base = os.path.basename(p)
+                basenames.setdefault(base.lower(), []).append(fid)
+                for t in _filename_subtokens(base):
+                    tokens.setdefault(t, []).append(fid)
+            self.paths = paths
+            self.basenames = basenames
+            self.tokens = tokens
+            self._built_at = time.monotonic()
+
+    def find_basename(self, wanted_low: str) -> Optional[str]:
+        ids = self.basenames.get(wanted_low)
+        return self.paths[ids[0]] if ids else None
+
+    def candidate_ids(self, tokens: List[str]) -> Optional[Set[int]]:
+        """
+        Union of posting lists for the query tokens, matched against the
+        index keys by substring so partial tokens ("repo" inside "report")
+        hit the same files a full filename scan would. Scoring only needs
+        files matching at least one token, so a token found nowhere in the
+        corpus contributes nothing either way. Returns None when nothing
+        matched, signalling the caller to scan all paths.
+        """
+        found: Set[int] = set()
+        for t in tokens:
+            for key, ids in self.tokens.items():
+                if t in key:
+                    found.update(ids)
+        return found or None
+
+
+_INDEXES: Dict[Tuple[str, ...], FileIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _get_index(allowed_roots: List[str]) -> FileIndex:
+    key = tuple(sorted(os.path.abspath(r) for r in allowed_roots))
+    with _INDEXES_LOCK:
+        idx = _INDEXES.get(key)
+        if idx is None:
+            idx = FileIndex(key)
+            _INDEXES[key] = idx
+    idx.refresh_if_stale()
+    return idx
+
+
+def _compile_token_pattern(tokens: List[str]) -> Optional[re.Pattern]:
+    """
+    Union regex over the query tokens: one scan per filename instead of
+    one `in` search per token (twice, with the all-tokens bonus).
     """
-    low = filename.lower()
     if not tokens:
+        return None
+    return re.compile("|".join(re.escape(t) for t in tokens))
+
+
+def _score_filename_match(token_pat: Optional[re.Pattern], n_tokens: int, filename: str) -> float:
+    """
+    Simple scoring purely on filename (single-pass scan).
+    """
+    if token_pat is None:
         return 0.0
 
-    score = 0.0
-    for t in tokens:
-        if t in low:
-            score += 2.0
+    low = filename.lower()
+    matched = set(token_pat.findall(low))
+    score = 2.0 * len(matched)
 
     # Bonus if ALL tokens appear
-    if score > 0 and all(t in low for t in tokens):
+    if matched and len(matched) == n_tokens:
         score += 3.0
 
     return score
 
 
-def _find_by_exact_basename(allowed_roots: List[str], wanted_name: str) -> Optional[str]:
-    """
-    Look for exact basename match (case-insensitive) inside allowed roots.
-    Returns the first match found.
-    """
-    wanted_low = wanted_name.lower()
-
-    for p in _walk_files(allowed_roots):
-        base = os.path.basename(p).lower()
-        if base == wanted_low:
-            return p
-    return None
-
-
 def search_files(
     query: str,
     allowed_roots: List[str],
@@ -139,34 +275,51 @@ def search_files(
     """
     preferred_files = preferred_files or []
 
+    # Normalize roots once per request instead of abspath-ing per check
+    roots_n = _normalize_roots(allowed_roots)
+
     # 0) If preferred file(s) given, validate they are under roots and return top hit(s)
     # (Your pipeline already forces preferred_files; this is an extra safety net.)
     preferred_hits: List[FileHit] = []
     for pf in preferred_files:
-        if pf and os.path.isfile(pf) and _is_under_roots(pf, allowed_roots):
+        if pf and os.path.isfile(pf) and _is_under_roots(pf, roots_n):
             preferred_hits.append(FileHit(path=pf, reason="preferred_file", score=9999.0))
 
     if preferred_hits:
         return preferred_hits[:limit]
 
+    # All lookups below hit the persistent index (built on first use,
+    # refreshed lazily when stale) instead of re-walking the tree.
+    index = _get_index(allowed_roots)
+
     # 1) If user used file:"X.pdf" directive, force exact match
     wanted = _extract_file_directive(query)
+    candidates: Iterable[str]
     if wanted:
-        exact = _find_by_exact_basename(allowed_roots, wanted)
+        exact = index.find_basename(wanted.lower())
         if exact:
             return [FileHit(path=exact, reason="explicit_filename_exact_match", score=9998.0)]
 
-        # If not exact, continue with fuzzy scoring, but boost those containing the wanted string
+        # No exact match: fuzzy-score, boosting names containing the wanted string
         tokens = _tokenize(wanted)
     else:
         tokens = _tokenize(query)
 
-    # 2) Walk allowed roots and score filenames
+    ids = index.candidate_ids(tokens)
+    if ids is not None and not wanted:
+        candidates = (index.paths[i] for i in ids)
+    else:
+        # No posting-list hit (partial/substring tokens) or directive fallback:
+        # scan the cached listing
+        candidates = index.paths
+
+    # 2) Score filenames
+    token_pat = _compile_token_pattern(tokens)
     hits: List[Tuple[float, str, str]] = []  # (score, path, reason)
 
-    for p in _walk_files(allowed_roots):
+    for p in candidates:
         fn = os.path.basename(p)
-        s = _score_filename_match(tokens, fn)
+        s = _score_filename_match(token_pat, len(tokens), fn)
 
         if wanted and wanted.lower() in fn.lower():
             s += 5.0  # strong boost for containing requested filename fragment
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
+import os
+import time
 
 
 @dataclass(frozen=True)
@@ -10,7 +13,13 @@ class PermissionResult:
     allowed_roots: List[Path]
 
 
-def normalize_roots(workspace_dirs: Iterable[str]) -> PermissionResult:
+# Resolving roots hits the filesystem (realpath + exists + is_dir per dir),
+# so memoize per input tuple with a coarse TTL to pick up created/removed dirs.
+_TTL_SECONDS = 60.0
+
+
+@lru_cache(maxsize=64)
+def _normalize_roots_cached(workspace_dirs: Tuple[str, ...], ttl_bucket: int) -> PermissionResult:
     roots: List[Path] = []
     for d in workspace_dirs:
         p = Path(d).expanduser().resolve()
@@ -19,15 +28,20 @@ def normalize_roots(workspace_dirs: Iterable[str]) -> PermissionResult:
     return PermissionResult(allowed_roots=roots)
 
 
+def normalize_roots(workspace_dirs: Iterable[str]) -> PermissionResult:
+    bucket = int(time.monotonic() / _TTL_SECONDS)
+    return _normalize_roots_cached(tuple(workspace_dirs), bucket)
+
+
 def is_path_allowed(path: Path, allowed_roots: List[Path]) -> bool:
     try:
-        rp = path.expanduser().resolve()
+        rp = str(path.expanduser().resolve())
     except Exception:
         return False
+    # Plain prefix compare: exception-driven relative_to is expensive when
+    # this runs once per file in a walk.
     for root in allowed_roots:
-        try:
-            rp.relative_to(root)
+        r = str(root)
+        if rp == r or rp.startswith(r + os.sep):
             return True
-        except Exception:
-            continue
     return False
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import List, Optional
+import asyncio
+import io
+import itertools
 import os
 import re
 
+from ..config import settings
 from ..schemas.dtos import Evidence, ChatRequest
 from .permissions import normalize_roots
 from .file_search import search_files
@@ -25,25 +29,41 @@ class LocalPipelineResult:
 # -------------------------
 # Helpers
 # -------------------------
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+_FILE_DIRECTIVE_RE = re.compile(r'\bfile\s*:\s*(".*?"|\S+)', re.IGNORECASE)
+
+
 def _tokenize(q: str) -> List[str]:
     q = (q or "").lower().strip()
-    return [t for t in re.split(r"[^a-z0-9]+", q) if len(t) >= 2]
+    return [t for t in _TOKEN_SPLIT_RE.split(q) if len(t) >= 2]
 
 
-def _is_under_roots(path: str, roots: Iterable[str]) -> bool:
+def _is_under_roots(path: str, normalized_roots: List[str]) -> bool:
+    """Roots must already be normalized (abspath) by the caller."""
     p = os.path.abspath(path)
-    for r in roots:
-        rr = os.path.abspath(r)
-        if p == rr:
-            return True
-        if p.startswith(rr + os.sep):
+    for rr in normalized_roots:
+        if p == rr or p.startswith(rr + os.sep):
             return True
     return False
 
 
 def _looks_like_explicit_file_query(text: str) -> bool:
     # supports: file:"X.pdf" or file:X.pdf or file: X.pdf
-    return bool(re.search(r'\bfile\s*:\s*(".*?"|\S+)', text or "", flags=re.IGNORECASE))
+    return bool(_FILE_DIRECTIVE_RE.search(text or ""))
+
+
+def _overlap_count(pat: re.Pattern, text: str) -> int:
+    return len({m.lower() for m in pat.findall(text)})
+
+
+# Per-hit trace evidence is debug-only: at INFO we skip ~15 Evidence
+# allocations + f-string formats per request.
+_DEBUG_EVIDENCE = settings.log_level.upper() == "DEBUG"
+
+
+def _ev_append(ev: List[Evidence], source: str, path: Optional[str] = None, note_fn=None) -> None:
+    if _DEBUG_EVIDENCE:
+        ev.append(Evidence(source=source, path=path, note=note_fn() if note_fn else None))
 
 
 _SMALLTALK_RE = re.compile(
@@ -55,7 +75,7 @@ _SMALLTALK_RE = re.compile(
 # -------------------------
 # Main pipeline
 # -------------------------
-def run_local_pipeline(
+async def run_local_pipeline(
     req: ChatRequest,
     intent: str,
     *,
@@ -95,11 +115,14 @@ def run_local_pipeline(
         )
     ev.append(Evidence(source="permissions", note=f"allowed_roots={len(perm.allowed_roots)}"))
 
+    # Normalize once per request; allowed_roots are already resolved Paths
+    roots_n = [str(r) for r in perm.allowed_roots]
+
     # 1) If UI selected a file, FORCE it
     hits = None
     if req.preferred_files:
         preferred_path = req.preferred_files[0]
-        if not _is_under_roots(preferred_path, perm.allowed_roots):
+        if not _is_under_roots(preferred_path, roots_n):
             ev.append(Evidence(source="permissions", path=preferred_path, note="preferred_file_outside_allowed_roots"))
             return LocalPipelineResult(
                 text="That selected file is outside your approved workspace folders. Please add its folder as a workspace.",
@@ -133,25 +156,48 @@ def run_local_pipeline(
         )
 
     tokens = _tokenize(req.user_text)
+    # Case-insensitive union scan: counts distinct tokens present without
+    # allocating a lowercased copy of the whole document per hit
+    overlap_pat = re.compile("|".join(re.escape(t) for t in tokens), re.IGNORECASE) if tokens else None
     best = None  # (overlap_score, path, raw_text, cleaned_text, file_type)
 
-    # 3) Extract + choose best hit
+    # Extract all candidate hits concurrently (I/O-heavy, independent),
+    # off the event loop. The preferred-file path always has exactly one
+    # hit, so its stop-after-first behavior is unaffected.
+    paths = [h.path for h in hits]
+    results = await asyncio.gather(*[asyncio.to_thread(extract_text, p) for p in paths])
+    extracted = dict(zip(paths, results))
+
+    # 3) Choose best hit (iterate in rank order for deterministic evidence)
     for h in hits:
         score = float(getattr(h, "score", 0.0))
         reason = str(getattr(h, "reason", "unknown"))
-        ev.append(Evidence(source="file_search", path=h.path, note=f"{reason} score={score:.2f}"))
+        _ev_append(ev, "file_search", h.path, lambda: f"{reason} score={score:.2f}")
 
-        ex = extract_text(h.path)
+        ex = extracted[h.path]
         raw_text = (ex.text or "").strip()
-        ev.append(Evidence(source="file_extract", path=h.path, note=f"type={ex.file_type} chars={len(raw_text)}"))
+        _ev_append(ev, "file_extract", h.path, lambda: f"type={ex.file_type} chars={len(raw_text)}")
 
         if not raw_text:
             continue
 
-        cleaned = clean_text(raw_text)
-        cleaned_text = (cleaned.cleaned or "").strip()
+        # cleaned_text is only consumed by the "other intents" branch (step 7);
+        # summarize/rewrite/etc. work on safe_raw, so skip the full-document
+        # clean for them.
+        cleaned_text = ""
+        if intent not in {"summarize", "rewrite", "improve", "tailor", "bulletize"}:
+            cleaned = await asyncio.to_thread(clean_text, raw_text)
+            cleaned_text = (cleaned.cleaned or "").strip()
+
+        # Single forced candidate: the overlap ranking signal is never used,
+        # so don't lowercase/scan the whole document to compute it.
+        if reason == "preferred_file" and len(hits) == 1:
+            best = (0, h.path, raw_text, cleaned_text, ex.file_type)
+            break
 
-        overlap = sum(1 for t in tokens if t in raw_text.lower())
+        # whole-document regex pass — keep it off the event loop like the
+        # other per-document work above
+        overlap = await asyncio.to_thread(_overlap_count, overlap_pat, raw_text) if overlap_pat else 0
         if best is None or overlap > best[0]:
             best = (overlap, h.path, raw_text, cleaned_text, ex.file_type)
 
@@ -166,10 +212,11 @@ def run_local_pipeline(
         )
 
     overlap, chosen_path, raw_text, cleaned_text, file_type = best
-    ev.append(Evidence(source="file_choice", path=chosen_path, note=f"content_overlap={overlap}"))
+    _ev_append(ev, "file_choice", chosen_path, lambda: f"content_overlap={overlap}")
 
-    # 4) Redact before using any document content
-    safe_raw = redact(raw_text)
+    # 4) Redact before using any document content (full-document regex
+    # substitution, so off the loop as well)
+    safe_raw = await asyncio.to_thread(redact, raw_text)
 
     doc_sensitive = (safe_raw != raw_text)
     if doc_sensitive:
@@ -177,7 +224,7 @@ def run_local_pipeline(
 
     # 5) Summarize (local-only)
     if intent == "summarize":
-        summary = summarize_document(safe_raw, detail_level="full")
+        summary = await asyncio.to_thread(summarize_document, safe_raw, detail_level="full")
 
         executive_bullets = getattr(summary, "executive_bullets", []) or []
         coverage_lines = getattr(summary, "coverage_lines", []) or []
@@ -186,44 +233,45 @@ def run_local_pipeline(
         warnings = getattr(summary, "warnings", []) or []
         section_bullets = getattr(summary, "section_bullets", {}) or {}
 
-        out_parts: List[str] = []
-        out_parts.append("Offline summary (local-only):\n")
-        out_parts.append(f"Source file:\n[{file_type.upper()}] {chosen_path}\n")
+        buf = io.StringIO()
+        w = buf.write
+        w("Offline summary (local-only):\n\n")
+        w(f"Source file:\n[{file_type.upper()}] {chosen_path}\n\n")
 
         if warnings:
-            out_parts.append("Warnings:")
-            for w in warnings[:6]:
-                out_parts.append(f"- {w}")
-            out_parts.append("")
+            w("Warnings:\n")
+            for warn in warnings[:6]:
+                w(f"- {warn}\n")
+            w("\n")
 
-        out_parts.append("Executive summary (bullets):")
-        out_parts.append("\n".join(executive_bullets) if executive_bullets else "- (no highlights found)")
-        out_parts.append("")
+        w("Executive summary (bullets):\n")
+        w("\n".join(executive_bullets) if executive_bullets else "- (no highlights found)")
+        w("\n\n")
 
         if isinstance(section_bullets, dict) and section_bullets:
-            out_parts.append("Section highlights:")
-            for sec, bs in list(section_bullets.items())[:10]:
-                out_parts.append(f"## {sec}")
+            w("Section highlights:\n")
+            for sec, bs in itertools.islice(section_bullets.items(), 10):
+                w(f"## {sec}\n")
                 for b in (bs or [])[:4]:
-                    out_parts.append(b)
-            out_parts.append("")
+                    w(b)
+                    w("\n")
+            w("\n")
 
-        out_parts.append("Document coverage (chunk-by-chunk):")
-        out_parts.append("\n".join(coverage_lines) if coverage_lines else "(no chunk summaries)")
-        out_parts.append("")
-        out_parts.append("Short summary:")
-        out_parts.append(short or "(not enough text)")
-        out_parts.append("")
-        out_parts.append("Coverage:")
-        out_parts.append(stats or "(no stats)")
-        out_parts.append("")
+        w("Document coverage (chunk-by-chunk):\n")
+        w("\n".join(coverage_lines) if coverage_lines else "(no chunk summaries)")
+        w("\n\nShort summary:\n")
+        w(short or "(not enough text)")
+        w("\n\nCoverage:\n")
+        w(stats or "(no stats)")
+        w("\n")
 
-        return LocalPipelineResult(text="\n".join(out_parts), evidence=ev, sensitive_detected=doc_sensitive)
+        return LocalPipelineResult(text=buf.getvalue(), evidence=ev, sensitive_detected=doc_sensitive)
 
     # 6) Rewrite / Improve / Bulletize / Tailor (Template-Based Enhancement Engine)
     if intent in {"rewrite", "improve", "tailor", "bulletize"}:
         # ✅ Use redacted RAW to preserve layout (CVs are layout-heavy)
-        tbe = enhance_with_context(
+        tbe = await asyncio.to_thread(
+            enhance_with_context,
             intent=intent,
             user_text=req.user_text,
             context_excerpt=safe_raw,
@@ -243,6 +291,10 @@ def run_local_pipeline(
 
     # 7) Other intents (keep previous behavior)
     context = cleaned_text if len(cleaned_text) >= 200 else safe_raw
-    enh = enhance_with_context(intent=intent, user_text=req.user_text, context_excerpt=context).text
+    enh = (
+        await asyncio.to_thread(
+            enhance_with_context, intent=intent, user_text=req.user_text, context_excerpt=context
+        )
+    ).text
     enh = f"Source file:\n[{file_type.upper()}] {chosen_path}\n\n{enh}"
     return LocalPipelineResult(text=enh, evidence=ev, sensitive_detected=doc_sensitive)
@@ -1,29 +1,45 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+from zlib import crc32
+import heapq
 import math
+import os
 import re
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+from ._nlp import get_nlp
+
 
 def _load_nlp():
-    try:
-        import spacy  # type: ignore
-        return spacy.load("en_core_web_sm")
-    except Exception:
-        return None
+    return get_nlp()
 
 
 NLP = _load_nlp()
 
-STOPWORDS = {
+STOPWORDS = frozenset({
     "the", "a", "an", "and", "or", "but", "if", "then", "else", "to", "of", "in", "on", "for", "with",
     "is", "are", "was", "were", "be", "been", "being", "this", "that", "these", "those", "it", "its",
     "as", "at", "by", "from", "into", "about", "over", "under", "we", "you", "i", "they", "he", "she",
     "my", "your", "our", "their", "me", "him", "her", "them",
-}
+})
 
 WORD_RE = re.compile(r"\b[a-zA-Z][a-zA-Z0-9_+\-./#]{1,}\b")
+_WS_TOKEN_RE = re.compile(r"\S+")
 LINE_SPLIT_RE = re.compile(r"\r?\n+")
 SENT_SPLIT_FALLBACK = re.compile(r"(?<=[.!?])\s+|\n+")
 BULLET_PREFIX_RE = re.compile(r"^\s*(?:[-*•\u2022]|➢|›|»)\s+")
@@ -63,13 +79,35 @@ class Summary:
 # ----------------------------
 # text utilities
 # ----------------------------
+_BULLET_CHARS = str.maketrans({"•": " "})
+_WS_RE = re.compile(r"\s+")
+
+
 def _norm_ws(s: str) -> str:
-    return " ".join((s or "").replace("\u2022", " ").replace("•", " ").split()).strip()
+    # single compiled substitution; split()+join allocates two lists per call
+    return _WS_RE.sub(" ", (s or "").translate(_BULLET_CHARS)).strip()
 
 
 def _tokens(text: str) -> List[str]:
-    words = [w.lower() for w in WORD_RE.findall(text or "")]
-    return [w for w in words if w not in STOPWORDS and len(w) >= 2]
+    # Single pass over finditer: no intermediate findall list, one output list
+    stop = STOPWORDS
+    out: List[str] = []
+    for m in WORD_RE.finditer(text or ""):
+        w = m.group(0).lower()
+        if len(w) >= 2 and w not in stop:
+            out.append(w)
+    return out
+
+
+def _sentences_spacy(t: str) -> List[str]:
+    try:
+        doc = NLP(t)
+        sents = [s.text.strip() for s in doc.sents if s.text.strip()]
+        if sents:
+            return sents
+    except Exception:
+        pass
+    return _sentences_regex(t)
 
 
 def _sentences(text: str) -> List[str]:
@@ -82,16 +120,10 @@ def _sentences(text: str) -> List[str]:
     t = (text or "").strip()
     if not t:
         return []
+    return _SENT_IMPL(t)
 
-    if NLP is not None:
-        try:
-            doc = NLP(t)
-            sents = [s.text.strip() for s in doc.sents if s.text.strip()]
-            if sents:
-                return sents
-        except Exception:
-            pass
 
+def _sentences_regex(t: str) -> List[str]:
     parts = SENT_SPLIT_FALLBACK.split(t)
     out: List[str] = []
     for p in parts:
@@ -104,72 +136,122 @@ def _sentences(text: str) -> List[str]:
     return out
 
 
+# NLP never changes within a process; bind the splitter once instead of
+# re-testing it on every call in the hot loops
+_SENT_IMPL = _sentences_spacy if NLP is not None else _sentences_regex
+
+
+# nlp.pipe tuning; batch size is env-tunable, n_process is raised only by
+# the summarize_documents batch path (worker spawn cost isn't worth it for
+# a single document). Passed down as parameters — concurrent callers (the
+# pipeline runs summarize_document from worker threads) must not see each
+# other's settings.
+_PIPE_BATCH_SIZE = int(os.getenv("EUROSEC_SPACY_BATCH_SIZE", "32"))
+
+
+def _sentences_batch(
+    texts: List[str], batch_size: Optional[int] = None, n_process: int = 1
+) -> List[List[str]]:
+    """
+    Split many texts at once via nlp.pipe (much faster than one NLP() call
+    per text); falls back to the regex splitter per text without spaCy.
+    """
+    stripped = [(t or "").strip() for t in texts]
+    if NLP is not None:
+        try:
+            out: List[List[str]] = []
+            piped = NLP.pipe(stripped, batch_size=batch_size or _PIPE_BATCH_SIZE, n_process=n_process)
+            for t, doc in zip(stripped, piped):
+                sents = [s.text.strip() for s in doc.sents if s.text.strip()]
+                out.append(sents if sents else (_sentences_regex(t) if t else []))
+            return out
+        except Exception:
+            pass
+    return [_sentences_regex(t) if t else [] for t in stripped]
+
+
 def _line_is_heading(line: str) -> bool:
     s = (line or "").strip()
     if not s:
         return False
-    if BULLET_PREFIX_RE.match(s):
+    # cheap rejections before entering the regex engine: headings start with
+    # an uppercase letter and never contain a period
+    if len(s) > 70 or not s[0].isupper() or "." in s:
         return False
-    if len(s) > 70:
+    if BULLET_PREFIX_RE.match(s):
         return False
     return HEADING_RE.match(s) is not None
 
 
-def _split_into_sections(text: str) -> Dict[str, str]:
+def _analyze(text: str) -> Tuple[str, Dict[str, str], List[str]]:
     """
-    Works for any doc:
-    - If headings exist -> section map
-    - Otherwise -> {"Document": text}
+    One linear scan over the document's lines producing:
+    - style: 'sectioned' / 'list-heavy' / 'generic'
+    - sections: heading -> text map (or {"Document": text} without headings)
+    - lines: the stripped non-empty lines, for callers that need them again
+
+    Style detection and section splitting previously each re-split the raw
+    text and re-ran the heading check on every line.
     """
     raw = (text or "").strip()
     if not raw:
-        return {}
+        return "generic", {}, []
 
     lines = [l.rstrip() for l in LINE_SPLIT_RE.split(raw) if l.strip()]
     if not lines:
-        return {"Document": raw}
+        return "generic", {"Document": raw}, []
 
-    sections: Dict[str, List[str]] = {}
+    sections: Dict[str, List[str]] = {"Document": []}
     current = "Document"
-    sections[current] = []
+    heading_cnt = 0
+    bullet_cnt = 0
 
-    heading_count = 0
     for line in lines:
-        if _line_is_heading(line):
-            heading_count += 1
-            current = line.strip().rstrip(":").title()
+        stripped = line.strip()
+        if _line_is_heading(stripped):
+            heading_cnt += 1
+            current = stripped.rstrip(":").title()
             sections.setdefault(current, [])
             continue
+        if BULLET_PREFIX_RE.match(stripped):
+            bullet_cnt += 1
         sections.setdefault(current, []).append(line)
 
+    if heading_cnt >= 3:
+        style = "sectioned"
+    elif bullet_cnt / max(1, len(lines)) >= 0.35:
+        style = "list-heavy"
+    else:
+        style = "generic"
+
     # If almost no headings, treat as generic doc
-    if heading_count < 2:
-        return {"Document": raw}
+    if heading_cnt < 2:
+        return style, {"Document": raw}, lines
 
     joined = {k: "\n".join(v).strip() for k, v in sections.items() if "\n".join(v).strip()}
-    return joined if joined else {"Document": raw}
+    return style, (joined if joined else {"Document": raw}), lines
 
 
 def _build_idf(items_tokens: List[List[str]]) -> Dict[str, float]:
-    df: Dict[str, int] = {}
+    df: Counter[str] = Counter()
     for toks in items_tokens:
-        for w in set(toks):
-            df[w] = df.get(w, 0) + 1
+        df.update(set(toks))
     n = max(1, len(items_tokens))
-    return {w: math.log((n + 1) / (c + 1)) + 1.0 for w, c in df.items()}
+    log = math.log
+    return {w: log((n + 1) / (c + 1)) + 1.0 for w, c in df.items()}
 
 
 def _score_sentence(sent_toks: List[str], idf: Dict[str, float], position: float) -> float:
     if not sent_toks:
         return 0.0
 
-    tf: Dict[str, int] = {}
-    for w in sent_toks:
-        tf[w] = tf.get(w, 0) + 1
+    tf = Counter(sent_toks)
 
+    log = math.log
+    idf_get = idf.get
     score = 0.0
     for w, c in tf.items():
-        score += (1.0 + math.log(c)) * idf.get(w, 1.0)
+        score += (1.0 + log(c)) * idf_get(w, 1.0)
 
     score /= max(1e-9, math.sqrt(len(sent_toks)))
 
@@ -184,10 +266,119 @@ def _score_sentence(sent_toks: List[str], idf: Dict[str, float], position: float
     return score
 
 
-def _jaccard(a: set[str], b: set[str]) -> float:
-    if not a or not b:
-        return 0.0
-    return len(a & b) / max(1, len(a | b))
+if np is not None and numba is not None:
+    # Optional accelerator: with numba installed the row reduction JIT-compiles
+    # to a tight numeric loop (compiled once per process, cached on disk).
+    @numba.njit(cache=True)
+    def _score_kernel(offsets, contrib, lens, positions):  # pragma: no cover
+        n = offsets.shape[0] - 1
+        out = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            s = 0.0
+            for j in range(offsets[i], offsets[i + 1]):
+                s += contrib[j]
+            s /= max(1e-9, math.sqrt(lens[i]))
+            s *= 1.10 - 0.25 * positions[i]
+            if lens[i] > 14:
+                s *= 0.90
+            if lens[i] == 0:
+                s = 0.0
+            out[i] = s
+        return out
+else:
+    _score_kernel = None
+
+
+def _score_all(sent_tokens: List[List[str]], idf: Dict[str, float]) -> List[float]:
+    """
+    Score every sentence in one pass. With NumPy available the hot loop is a
+    CSR-style reduceat over (1 + log tf) * idf contributions; otherwise fall
+    back to per-sentence _score_sentence calls. Same numbers either way.
+    """
+    n = len(sent_tokens)
+    if np is None:
+        return [
+            _score_sentence(toks, idf, i / max(1, n - 1))
+            for i, toks in enumerate(sent_tokens)
+        ]
+
+    idf_get = idf.get
+    data: List[int] = []
+    idf_vals: List[float] = []
+    offsets = [0]
+    for toks in sent_tokens:
+        for w, c in Counter(toks).items():
+            data.append(c)
+            idf_vals.append(idf_get(w, 1.0))
+        offsets.append(len(data))
+
+    lens = np.array([len(t) for t in sent_tokens], dtype=np.float64)
+    if not data:
+        return [0.0] * n
+
+    contrib = (1.0 + np.log(np.asarray(data, dtype=np.float64))) * np.asarray(idf_vals)
+    positions = np.arange(n, dtype=np.float64) / max(1, n - 1)
+
+    if _score_kernel is not None:
+        offs = np.asarray(offsets, dtype=np.int64)
+        return _score_kernel(offs, contrib, lens, positions).tolist()
+
+    nnz = np.diff(offsets)
+    starts = np.minimum(np.asarray(offsets[:-1]), len(data) - 1)
+    sums = np.add.reduceat(contrib, starts)
+    sums[nnz == 0] = 0.0
+
+    scores = sums / np.sqrt(np.maximum(lens, 1e-9))
+    scores *= 1.10 - 0.25 * positions
+    # penalize "tool dump" lines, same as _score_sentence
+    scores[lens > 14] *= 0.90
+    scores[lens == 0] = 0.0
+    return scores.tolist()
+
+
+# ----------------------------
+# near-duplicate filtering (MinHash)
+# ----------------------------
+# Exact Jaccard on token sets costs a set-union per comparison and dominates
+# bullet selection on long documents. A 16-element MinHash signature estimates
+# Jaccard via positional match rate; crc32 with per-slot start values gives 16
+# cheap, deterministic hash functions (no per-run hash() salt).
+_SIG_K = 16
+_SIG_SEEDS = tuple(range(_SIG_K))
+
+
+def _minhash(toks_set: set[str]) -> List[int]:
+    enc = [w.encode("utf-8", "ignore") for w in toks_set]
+    return [min(crc32(b, seed) for b in enc) for seed in _SIG_SEEDS]
+
+
+class _SigSet:
+    """Grow-only stack of MinHash signatures with a max-similarity probe."""
+
+    def __init__(self, sigs: Optional[Iterable[List[int]]] = None):
+        self._sigs: List[List[int]] = list(sigs) if sigs is not None else []
+        self._arr = None  # lazily rebuilt numpy stack
+
+    def __iter__(self):
+        return iter(self._sigs)
+
+    def add(self, sig: List[int]) -> None:
+        self._sigs.append(sig)
+        self._arr = None
+
+    def too_similar(self, sig: List[int], threshold: float) -> bool:
+        if not self._sigs:
+            return False
+        if np is not None:
+            if self._arr is None:
+                self._arr = np.asarray(self._sigs, dtype=np.uint32)
+            probe = np.asarray(sig, dtype=np.uint32)
+            return float((self._arr == probe).mean(axis=1).max()) > threshold
+        k = float(_SIG_K)
+        for u in self._sigs:
+            if sum(a == b for a, b in zip(sig, u)) / k > threshold:
+                return True
+        return False
 
 
 def _clip(s: str, n: int) -> str:
@@ -195,57 +386,51 @@ def _clip(s: str, n: int) -> str:
     return s if len(s) <= n else s[: n - 3].rstrip() + "..."
 
 
-def _chunk_by_words(text: str, words_per_chunk: int, overlap_words: int) -> List[str]:
-    ws = (text or "").split()
-    if not ws:
-        return []
+def _chunk_by_words(text: str, words_per_chunk: int, overlap_words: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Chunk by word count, returning each chunk's text and its (start, end)
+    character span in the original string so callers can map precomputed
+    per-sentence offsets onto chunks without re-splitting chunk text.
+    """
+    t = text or ""
+    # compact int buffers instead of per-word tuples; chunks are plain slices
+    starts = array("i")
+    ends = array("i")
+    for m in _WS_TOKEN_RE.finditer(t):
+        s, e = m.span()
+        starts.append(s)
+        ends.append(e)
+    nwords = len(starts)
+    if not nwords:
+        return [], []
 
     if words_per_chunk <= 0:
-        return [" ".join(ws)]
+        lo, hi = starts[0], ends[-1]
+        return [t[lo:hi]], [(lo, hi)]
 
     out: List[str] = []
-    i = 0
+    ranges: List[Tuple[int, int]] = []
     step = max(1, words_per_chunk - max(0, overlap_words))
-    while i < len(ws):
-        out.append(" ".join(ws[i:i + words_per_chunk]))
+    i = 0
+    while i < nwords:
+        lo = starts[i]
+        hi = ends[min(i + words_per_chunk, nwords) - 1]
+        out.append(t[lo:hi])
+        ranges.append((lo, hi))
         i += step
-    return out
-
-
-def _detect_doc_style(text: str) -> str:
-    """
-    Heuristic:
-    - If many headings -> 'sectioned'
-    - If mostly bullet lines -> 'list-heavy'
-    - Else -> 'generic'
-    """
-    raw = (text or "").strip()
-    if not raw:
-        return "generic"
-    lines = [l.strip() for l in LINE_SPLIT_RE.split(raw) if l.strip()]
-    if not lines:
-        return "generic"
+    return out, ranges
 
-    heading_cnt = sum(1 for l in lines if _line_is_heading(l))
-    bullet_cnt = sum(1 for l in lines if BULLET_PREFIX_RE.match(l))
-    ratio_bullets = bullet_cnt / max(1, len(lines))
 
-    if heading_cnt >= 3:
-        return "sectioned"
-    if ratio_bullets >= 0.35:
-        return "list-heavy"
-    return "generic"
-
-
-def _line_sentences(text: str) -> List[str]:
+def _line_sentences(text: str, lines: Optional[List[str]] = None) -> List[str]:
     """
     For list-heavy PDFs (CVs), line-based "sentences" often cover content better than punctuation splitting.
+    Pass `lines` when the caller already split the text (e.g. via _analyze).
     """
-    raw = (text or "").strip()
-    if not raw:
-        return []
-
-    lines = [l.strip() for l in LINE_SPLIT_RE.split(raw) if l.strip()]
+    if lines is None:
+        raw = (text or "").strip()
+        if not raw:
+            return []
+        lines = [l.strip() for l in LINE_SPLIT_RE.split(raw) if l.strip()]
     out: List[str] = []
 
     for ln in lines:
@@ -260,7 +445,13 @@ def _line_sentences(text: str) -> List[str]:
     return out
 
 
-def summarize_document(text: str, detail_level: str = "full") -> Summary:
+def summarize_document(
+    text: str,
+    detail_level: str = "full",
+    *,
+    pipe_batch_size: Optional[int] = None,
+    pipe_n_process: int = 1,
+) -> Summary:
     raw = (text or "").strip()
     warnings: List[str] = []
 
@@ -276,19 +467,22 @@ def summarize_document(text: str, detail_level: str = "full") -> Summary:
             "Extracted text looks short. If the document is scanned or layout-heavy, OCR may be needed for full coverage."
         )
 
-    style = _detect_doc_style(raw)
-    sections = _split_into_sections(raw)
+    style, sections, raw_lines = _analyze(raw)
 
     # Build sentence pool (mix sentence + line extraction for list-heavy)
     sent_meta: List[Tuple[str, str]] = []
 
-    for sec, sec_text in sections.items():
-        sents = _sentences(sec_text)
+    sec_items = list(sections.items())
+    sec_sent_lists = _sentences_batch(
+        [t for _, t in sec_items], batch_size=pipe_batch_size, n_process=pipe_n_process
+    )
+    for (sec, sec_text), sents in zip(sec_items, sec_sent_lists):
         sent_meta.extend((sec, s) for s in sents)
 
-        # For list-heavy docs, add line-based candidates too
+        # For list-heavy docs, add line-based candidates too (reuse the
+        # already-split lines when the section is the whole document)
         if style == "list-heavy":
-            line_sents = _line_sentences(sec_text)
+            line_sents = _line_sentences(sec_text, raw_lines if sec_text is raw else None)
             sent_meta.extend((sec, s) for s in line_sents)
 
     # Dedup sentence pool (keep order)
@@ -308,36 +502,51 @@ def summarize_document(text: str, detail_level: str = "full") -> Summary:
     sent_tokens = [_tokens(s) for _, s in sent_meta]
     idf = _build_idf(sent_tokens)
 
-    scored: List[Tuple[float, int]] = []
-    n = len(sent_meta)
-    for i, (_, _) in enumerate(sent_meta):
-        toks = sent_tokens[i]
-        pos = i / max(1, n - 1)
-        sc = _score_sentence(toks, idf, pos)
+    base_scores = _score_all(sent_tokens, idf)
 
+    scored: List[Tuple[float, int]] = []
+    for i, sc in enumerate(base_scores):
         # for sectioned docs, slightly boost non-“Document” sections
         if style == "sectioned" and sent_meta[i][0] != "Document":
             sc *= 1.08
 
         scored.append((sc, i))
 
-    scored.sort(reverse=True, key=lambda x: x[0])
+    # Only the strongest few dozen sentences are ever displayed, so take a
+    # top-K (O(N log K)) instead of fully sorting all N sentences. The
+    # coverage loop reads scores by index and needs no ordering at all.
+    exec_target = 10 if detail_level == "full" else 6
+    per_sec_target = 3 if detail_level == "full" else 2
+    max_needed = exec_target * 4 + per_sec_target * len(sections) + 40
+    top = heapq.nlargest(max_needed, scored, key=lambda x: x[0])
+
+    # Scores addressable by sentence index, for the per-section picks and the
+    # coverage loop below — neither needs a global ordering
+    score_by_idx = [0.0] * len(sent_meta)
+    for sc, idx in scored:
+        score_by_idx[idx] = sc
 
     # Executive bullets (global highlights, non-redundant)
-    exec_target = 10 if detail_level == "full" else 6
     exec_bullets: List[str] = []
-    used_sets: List[set[str]] = []
+    used_sigs = _SigSet()
+    sent_sigs: List[Optional[List[int]]] = [None] * len(sent_meta)
 
-    for _, idx in scored:
+    def sig_at(idx: int) -> List[int]:
+        sig = sent_sigs[idx]
+        if sig is None:
+            sig = sent_sigs[idx] = _minhash(set(sent_tokens[idx]))
+        return sig
+
+    for _, idx in top:
         if len(exec_bullets) >= exec_target:
             break
-        toks_set = set(sent_tokens[idx])
-        if not toks_set:
+        if not sent_tokens[idx]:
             continue
-        if any(_jaccard(toks_set, u) > 0.45 for u in used_sets):
+        sig = sig_at(idx)
+        if used_sigs.too_similar(sig, 0.45):
             continue
         exec_bullets.append(f"- {_clip(sent_meta[idx][1], 220)}")
-        used_sets.append(toks_set)
+        used_sigs.add(sig)
 
     # If we somehow got none (rare), fallback to strongest non-empty lines
     if not exec_bullets:
@@ -354,25 +563,26 @@ def summarize_document(text: str, detail_level: str = "full") -> Summary:
     # Section bullets (only meaningful if actually sectioned)
     section_bullets: Dict[str, List[str]] = {}
     if style == "sectioned":
+        # Group over the full pool, not the global top-K: the position prior
+        # concentrates the top-K in early sections, which would silently drop
+        # later sections' highlights. A per-section top-K keeps this O(N).
         by_sec: Dict[str, List[int]] = {}
-        for _, idx in scored:
-            sec = sent_meta[idx][0]
-            by_sec.setdefault(sec, []).append(idx)
+        for i, (sec, _) in enumerate(sent_meta):
+            by_sec.setdefault(sec, []).append(i)
 
-        per_sec_target = 3 if detail_level == "full" else 2
         for sec, idxs in by_sec.items():
             picks: List[str] = []
-            sec_used: List[set[str]] = []
-            for idx in idxs:
+            sec_used = _SigSet()
+            for idx in heapq.nlargest(per_sec_target * 4, idxs, key=score_by_idx.__getitem__):
                 if len(picks) >= per_sec_target:
                     break
-                toks_set = set(sent_tokens[idx])
-                if not toks_set:
+                if not sent_tokens[idx]:
                     continue
-                if any(_jaccard(toks_set, u) > 0.55 for u in sec_used):
+                sig = sig_at(idx)
+                if sec_used.too_similar(sig, 0.55):
                     continue
                 picks.append(f"- {_clip(sent_meta[idx][1], 230)}")
-                sec_used.append(toks_set)
+                sec_used.add(sig)
             if picks:
                 section_bullets[sec] = picks
 
@@ -380,51 +590,104 @@ def summarize_document(text: str, detail_level: str = "full") -> Summary:
     words_per_chunk = 260 if detail_level == "full" else 380
     overlap_words = 70 if detail_level == "full" else 40
 
-    chunks = _chunk_by_words(raw, words_per_chunk=words_per_chunk, overlap_words=overlap_words)
+    chunks, chunk_spans = _chunk_by_words(raw, words_per_chunk=words_per_chunk, overlap_words=overlap_words)
 
     max_chunks = 14 if detail_level == "full" else 8
     if len(chunks) > max_chunks:
         idxs = [round(i * (len(chunks) - 1) / (max_chunks - 1)) for i in range(max_chunks)]
         chunks = [chunks[i] for i in idxs]
+        chunk_spans = [chunk_spans[i] for i in idxs]
 
     coverage_lines: List[str] = []
-    avoid_sets: List[set[str]] = [set(u) for u in used_sets]
-
-    for ci, chunk in enumerate(chunks, start=1):
-        sents = _sentences(chunk)
-        if style == "list-heavy":
-            sents = sents + _line_sentences(chunk)
+    avoid_sigs = _SigSet(used_sigs)
+
+    # Chunks overlap, so the same sentence is tokenized many times in the
+    # loop below. Memoize per sentence string, seeded with the pool tokens.
+    _tok_cache: Dict[str, List[str]] = {s: sent_tokens[i] for i, (_, s) in enumerate(sent_meta)}
+    _sig_cache: Dict[str, List[int]] = {
+        s: sent_sigs[i] for i, (_, s) in enumerate(sent_meta) if sent_sigs[i] is not None
+    }
+
+    def toks_of(s: str) -> List[str]:
+        c = _tok_cache.get(s)
+        if c is None:
+            c = _tokens(s)
+            _tok_cache[s] = c
+        return c
+
+    def sig_of(s: str, toks: List[str]) -> List[int]:
+        c = _sig_cache.get(s)
+        if c is None:
+            c = _minhash(set(toks))
+            _sig_cache[s] = c
+        return c
+
+    # Map each pooled sentence to its character offset in `raw` with a forward
+    # cursor. Sentences whose text was normalized away from the raw form are
+    # located by a short prefix probe. Chunks then pick from already-scored
+    # sentences by offset (bisect) instead of re-splitting and re-scoring
+    # their text on every pass.
+    located: List[Tuple[int, int]] = []  # (char offset in raw, sentence index)
+    cursor = 0
+    for i, (_, s) in enumerate(sent_meta):
+        pos = raw.find(s, cursor)
+        if pos < 0:
+            probe = s[:40].rstrip(". ")
+            if probe:
+                pos = raw.find(probe, cursor)
+                if pos < 0:
+                    pos = raw.find(probe)
+        if pos >= 0:
+            located.append((pos, i))
+            cursor = max(cursor, pos + 1)
+    located.sort()
+    loc_offsets = [p for p, _ in located]
+
+    for ci, (chunk, (lo, hi)) in enumerate(zip(chunks, chunk_spans), start=1):
+        bucket = [idx for _, idx in located[bisect_left(loc_offsets, lo):bisect_left(loc_offsets, hi)]]
+        bucket.sort(key=lambda i: score_by_idx[i], reverse=True)
 
         best_sent = None
-        best_score = -1.0
+        best_sig: Optional[List[int]] = None
 
-        # Pass 1: try to avoid repeating executive bullets
-        for s in sents:
-            toks = _tokens(s)
-            if not toks:
+        # Pass 1: best-scored sentence in range that doesn't repeat earlier picks
+        for idx in bucket:
+            if not sent_tokens[idx]:
                 continue
-            toks_set = set(toks)
-            if any(_jaccard(toks_set, u) > 0.60 for u in avoid_sets):
+            sig = sig_at(idx)
+            if avoid_sigs.too_similar(sig, 0.60):
                 continue
-            sc = _score_sentence(toks, idf, position=0.35)
-            if sc > best_score:
-                best_score = sc
-                best_sent = s
+            best_sent, best_sig = sent_meta[idx][1], sig
+            break
+
+        # Pass 2 (fallback): if everything was filtered out, pick best available
+        if best_sent is None:
+            for idx in bucket:
+                if sent_tokens[idx]:
+                    best_sent, best_sig = sent_meta[idx][1], sig_at(idx)
+                    break
 
-        # Pass 2 (fallback): if everything was filtered out, just pick best available
+        # Pass 3 (rare): offset mapping found no pooled sentence in this window
+        # (heavily normalized text) — split just this chunk like before
         if best_sent is None:
+            best_score = -1.0
+            sents = _sentences(chunk)
+            if style == "list-heavy":
+                sents = sents + _line_sentences(chunk)
             for s in sents:
-                toks = _tokens(s)
+                toks = toks_of(s)
                 if not toks:
                     continue
                 sc = _score_sentence(toks, idf, position=0.35)
                 if sc > best_score:
                     best_score = sc
                     best_sent = s
+            if best_sent is not None:
+                best_sig = sig_of(best_sent, toks_of(best_sent))
 
         if best_sent:
             coverage_lines.append(f"Chunk {ci}: {_clip(best_sent, 260)}")
-            avoid_sets.append(set(_tokens(best_sent)))
+            avoid_sigs.add(best_sig)
 
     stats = f"words={total_words} chars={total_chars} style={style} sections={len(sections)} chunks={len(chunks)} detail={detail_level}"
     if not coverage_lines:
@@ -438,3 +701,30 @@ def summarize_document(text: str, detail_level: str = "full") -> Summary:
         stats=stats,
         warnings=warnings,
     )
+
+
+def summarize_documents(
+    texts: List[str],
+    detail_level: str = "full",
+    n_process: int = 1,
+    batch_size: Optional[int] = None,
+) -> List[Summary]:
+    """
+    Summarize many documents in one call.
+
+    For large batches spaCy can fan sentence splitting out over worker
+    processes; `n_process` / `batch_size` are passed down to the nlp.pipe
+    calls of this batch only — concurrent interactive summarize_document
+    calls (the pipeline runs them from worker threads) keep their own
+    single-process defaults. Defaults keep behavior identical to calling
+    summarize_document in a loop.
+    """
+    return [
+        summarize_document(
+            t,
+            detail_level=detail_level,
+            pipe_batch_size=int(batch_size) if batch_size else None,
+            pipe_n_process=max(1, int(n_process)),
+        )
+        for t in texts
+    ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import re
 
@@ -22,12 +23,25 @@ _PHONE_RE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
 _URL_RE = re.compile(r"https?://\S+|www\.\S+", re.IGNORECASE)
 
 # lines that are usually NOT content
-_JUNK_LINE_RE = re.compile(
-    r"^\s*(\[REDACTED_[A-Z_]+\]|"
-    r"(tanay|khilare)\b|"
-    r"(stuttgart|germany)\b|"
-    r"(linkedin|leetcode)\b.*|"
-    r")\s*$",
+_JUNK_LINE_PATTERN = (
+    r"^\s*(?:\[REDACTED_[A-Z_]+\]|"
+    r"(?:tanay|khilare)\b|"
+    r"(?:stuttgart|germany)\b|"
+    r"(?:linkedin|leetcode)\b.*"
+    r")\s*$"
+)
+
+# One alternation per line instead of four separate engine entries
+# (email / phone / url / junk-line). The url hit still needs the
+# linkedin/leetcode qualifier, checked on lastgroup by the callers.
+_CONTACT_ANY_RE = re.compile(
+    rf"(?P<email>{_EMAIL_RE.pattern})"
+    rf"|(?P<phone>{_PHONE_RE.pattern})"
+    rf"|(?P<url>{_URL_RE.pattern})",
+    re.IGNORECASE,
+)
+_JUNK_ANY_RE = re.compile(
+    rf"{_CONTACT_ANY_RE.pattern}|(?P<junk>{_JUNK_LINE_PATTERN})",
     re.IGNORECASE,
 )
 
@@ -37,48 +51,57 @@ _HEADING_RE = re.compile(r"^\s*([A-Z][A-Z0-9 &/\-]{3,}|[A-Z][a-zA-Z ]{2,})\s*:?\
 # bullet markers
 _BULLET_RE = re.compile(r"^\s*(?:[-*•\u2022]|➢|›|»|o)\s+(.*)$")
 
+# hot-loop patterns, compiled once
+_LINE_SPLIT_RE = re.compile(r"\r?\n+")
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+| \|\s+|;\s+")
+_KW_PREFIX_RE = re.compile(r"^[#>\-*•\u2022]+\s*")
+_BULLET_CHARS = str.maketrans({"•": " "})
+_WS_RE = re.compile(r"\s+")
+
 
 def _norm_ws(s: str) -> str:
-    return " ".join((s or "").replace("\u2022", " ").replace("•", " ").split()).strip()
+    # single compiled substitution; split()+join allocates two lists per call
+    return _WS_RE.sub(" ", (s or "").translate(_BULLET_CHARS)).strip()
 
 
 def _is_heading(line: str) -> bool:
     s = (line or "").strip()
     if not s:
         return False
-    if len(s) > 70:
+    # cheap rejections before entering the regex engine: headings start with
+    # an uppercase letter and never contain a period
+    if len(s) > 70 or not s[0].isupper() or "." in s:
         return False
     if _BULLET_RE.match(s):
         return False
     return _HEADING_RE.match(s) is not None
 
 
-def _looks_like_contact(line: str) -> bool:
-    s = line or ""
-    if _EMAIL_RE.search(s):
-        return True
-    if _PHONE_RE.search(s):
-        return True
-    if _URL_RE.search(s) and ("linkedin" in s.lower() or "leetcode" in s.lower()):
-        return True
+def _matches_any(pat: re.Pattern, s: str) -> bool:
+    for m in pat.finditer(s):
+        if m.lastgroup != "url":
+            return True
+        low = s.lower()
+        if "linkedin" in low or "leetcode" in low:
+            return True
     return False
 
 
+def _looks_like_contact(line: str) -> bool:
+    return _matches_any(_CONTACT_ANY_RE, line or "")
+
+
 def _is_junk(line: str) -> bool:
     s = _norm_ws(line)
     if not s:
         return True
-    if _looks_like_contact(s):
-        return True
-    if _JUNK_LINE_RE.match(s):
-        return True
     # lines that are just punctuation or too short
     if len(s) < 4:
         return True
     # super common CV noise lines
     if s.lower() in {"curriculum vitae", "resume", "cv"}:
         return True
-    return False
+    return _matches_any(_JUNK_ANY_RE, s)
 
 
 def _split_sections(text: str) -> Dict[str, List[str]]:
@@ -87,7 +110,7 @@ def _split_sections(text: str) -> Dict[str, List[str]]:
     Works for CVs + any doc.
     """
     raw = (text or "").strip()
-    lines = [l.rstrip() for l in re.split(r"\r?\n+", raw) if l.strip()]
+    lines = [l.rstrip() for l in _LINE_SPLIT_RE.split(raw) if l.strip()]
     if not lines:
         return {"Document": []}
 
@@ -128,7 +151,7 @@ def _extract_items(lines: List[str]) -> Tuple[List[str], List[str]]:
 
         # split long non-bullet lines into sentence-like chunks
         # keep deterministic and simple
-        parts = re.split(r"(?<=[.!?])\s+| \|\s+|;\s+", line)
+        parts = _SENT_SPLIT_RE.split(line)
         for p in parts:
             p = _norm_ws(p)
             if len(p) >= 18 and not _looks_like_contact(p):
@@ -151,6 +174,7 @@ _ROLE_KEYWORDS: Dict[str, List[str]] = {
 }
 
 
+@lru_cache(maxsize=128)
 def _infer_target_role(user_text: str) -> Optional[str]:
     t = (user_text or "").lower()
     if "cyber" in t or "security" in t or "soc" in t:
@@ -204,27 +228,19 @@ def _extract_keywords_from_public_knowledge(public_knowledge: Optional[str]) ->
     if not public_knowledge:
         return []
 
-    lines = [l.strip() for l in public_knowledge.splitlines() if l.strip()]
-    out: List[str] = []
-    for l in lines:
-        l = re.sub(r"^[#>\-*•\u2022]+\s*", "", l).strip()
+    # filter + dedupe in one pass: lowercase -> first original (dicts keep
+    # insertion order, so this replaces the list + seen-set second pass)
+    deduped: Dict[str, str] = {}
+    for l in public_knowledge.splitlines():
+        l = _KW_PREFIX_RE.sub("", l.strip()).strip()
         if not l:
             continue
         # keep short items that look like skills/tools/responsibilities
-        if len(l) <= 60 and not l.lower().startswith(("certainly", "here's", "responsibilities", "skills", "tools")):
-            out.append(l)
-
-    # dedupe
-    seen = set()
-    deduped: List[str] = []
-    for x in out:
-        nx = x.lower()
-        if nx in seen:
-            continue
-        seen.add(nx)
-        deduped.append(x)
+        low = l.lower()
+        if len(l) <= 60 and not low.startswith(("certainly", "here's", "responsibilities", "skills", "tools")):
+            deduped.setdefault(low, l)
 
-    return deduped[:24]
+    return list(deduped.values())[:24]
 
 
 def _format_keywords_block(keywords: List[str]) -> str:
@@ -237,7 +253,14 @@ def _format_keywords_block(keywords: List[str]) -> str:
 # Public API
 # ----------------------------
 def detect_doc_type(context_excerpt: str) -> str:
-    low = (context_excerpt or "").lower()
+    # key the cache on the first 2KB — enough for the heuristic, and avoids
+    # hashing a full document on every repeated chat turn
+    return _detect_doc_type_cached((context_excerpt or "")[:2048])
+
+
+@lru_cache(maxsize=128)
+def _detect_doc_type_cached(excerpt_head: str) -> str:
+    low = excerpt_head.lower()
     # very light heuristic
     if "education" in low and "skills" in low and ("experience" in low or "projects" in low):
         return "cv"
@@ -307,20 +330,13 @@ def enhance_with_context(
     # For CV tailoring, also keep an “Other skills from CV” block (optional)
     other_skills: List[str] = []
     if doc_type == "cv":
-        # pick skill-like lines but do not flood output
+        # pick skill-like lines, deduped in insertion order, capped
+        ded: Dict[str, str] = {}
         for x in all_bullets:
             if "," in x and len(x) <= 160:
-                other_skills.append(_norm_ws(x))
-        # dedupe and cap
-        seen = set()
-        ded = []
-        for x in other_skills:
-            nx = x.lower()
-            if nx in seen:
-                continue
-            seen.add(nx)
-            ded.append(x)
-        other_skills = ded[:10]
+                x = _norm_ws(x)
+                ded.setdefault(x.lower(), x)
+        other_skills = list(ded.values())[:10]
 
     other_block = ""
     if other_skills:
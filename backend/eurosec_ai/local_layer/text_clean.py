@@ -3,12 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List
 
+from ._nlp import get_nlp
+
+
 def _load_nlp():
-    try:
-        import spacy
-        return spacy.load("en_core_web_sm")
-    except Exception:
-        return None
+    return get_nlp()
 
 NLP = _load_nlp()
 
@@ -19,23 +18,33 @@ class CleanedText:
     sentences: List[str]
 
 
+def _sents_spacy(raw: str, max_sentences: int) -> List[str]:
+    doc = NLP(raw)
+    sents = [s.text.strip() for s in doc.sents if s.text.strip()]
+    return sents[:max_sentences]
+
+
+def _sents_fallback(raw: str, max_sentences: int) -> List[str]:
+    sents = [s.strip() for s in raw.split(".") if s.strip()]
+    return [s + "." for s in sents[:max_sentences]]
+
+
+# NLP never changes within a process; bind the splitter once at import
+_SENT_IMPL = _sents_spacy if NLP is not None else _sents_fallback
+
+
 def clean_text(text: str, max_sentences: int = 20, max_chars: int = 50_000) -> CleanedText:
     raw = (text or "").strip()
     if not raw:
         return CleanedText(cleaned="", sentences=[])
 
+    # truncate first so we never normalize (or parse) text we throw away;
+    # the 2x slack keeps whitespace collapsing from shaving below max_chars
+    if len(raw) > max_chars * 2:
+        raw = raw[: max_chars * 2]
     raw = " ".join(raw.split())  # normalize whitespace
     raw = raw[:max_chars]
 
-    if NLP is None:
-        # fallback sentence split
-        sents = [s.strip() for s in raw.split(".") if s.strip()]
-        sents = [s + "." for s in sents[:max_sentences]]
-        cleaned = "\n".join(sents)
-        return CleanedText(cleaned=cleaned, sentences=sents)
-
-    doc = NLP(raw)
-    sents = [s.text.strip() for s in doc.sents if s.text.strip()]
-    sents = sents[:max_sentences]
+    sents = _SENT_IMPL(raw, max_sentences)
     cleaned = "\n".join(sents)
     return CleanedText(cleaned=cleaned, sentences=sents)
@@ -2,17 +2,36 @@ import logging
 from .config import settings
 
 class RedactingFilter(logging.Filter):
+    # Never log user raw text or extracted file contents.
+    _BLOCKED = ("RAW_USER_TEXT=", "FILE_TEXT=")
+
     def filter(self, record: logging.LogRecord) -> bool:
-        # Never log user raw text or extracted file contents.
-        msg = record.getMessage()
-        blocked_markers = ["RAW_USER_TEXT=", "FILE_TEXT="]
-        for m in blocked_markers:
-            if m in msg:
-                record.msg = "REDACTED_LOG_BLOCKED"
-                record.args = ()
+        # Substring-check the raw msg (and string args) instead of calling
+        # record.getMessage(), which %-formats every record — including ones
+        # a handler is about to discard anyway.
+        blocked = self._BLOCKED
+        msg = record.msg
+        hit = isinstance(msg, str) and (blocked[0] in msg or blocked[1] in msg)
+        if not hit and record.args:
+            args = record.args.values() if isinstance(record.args, dict) else (
+                record.args if isinstance(record.args, tuple) else (record.args,)
+            )
+            hit = any(
+                isinstance(a, str) and (blocked[0] in a or blocked[1] in a)
+                for a in args
+            )
+        if hit:
+            record.msg = "REDACTED_LOG_BLOCKED"
+            record.args = ()
         return True
 
 def setup_logging():
     logging.basicConfig(level=getattr(logging, settings.log_level, logging.INFO))
     root = logging.getLogger()
-    root.addFilter(RedactingFilter())
+    flt = RedactingFilter()
+    root.addFilter(flt)
+    # Logger-level filters don't run for records logged via child loggers;
+    # attach the same filter to the root handlers so every record that is
+    # actually emitted passes through it exactly once.
+    for h in root.handlers:
+        h.addFilter(flt)
@@ -10,32 +10,39 @@ from pathlib import Path
 # Keep your original call (do not remove)
 load_dotenv()
 
+# Backend project root (backend/) relative to this file, resolved once
+# main.py likely at backend/eurosec_ai/main.py -> parents[1] = backend/
+_BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
 # ✅ ADDITION: also try loading .env from common packaged/dev locations
 def _load_dotenv_robust() -> None:
+    # If the initial load_dotenv() (or the parent process) already supplied
+    # the credential this search exists to find, skip the filesystem walk —
+    # it runs on every server start and directly delays readiness. Gate on
+    # OPENAI_API_KEY alone: launcher vars (EUROSEC_*) or tuning vars like
+    # OPENAI_BASE_URL/OPENAI_MODEL being exported says nothing about whether
+    # the packaged .env with the key was loaded.
+    if "OPENAI_API_KEY" in os.environ:
+        return
+
     candidates = []
 
     # 1) Packaged binary location (PyInstaller): same folder as executable
     try:
-        exe_dir = Path(sys.executable).resolve().parent
-        candidates.append(exe_dir / ".env")
+        candidates.append(os.path.join(os.path.dirname(os.path.realpath(sys.executable)), ".env"))
     except Exception:
         pass
 
     # 2) Current working directory (sometimes used in dev)
-    try:
-        candidates.append(Path(os.getcwd()) / ".env")
-    except Exception:
-        pass
+    candidates.append(os.path.join(os.getcwd(), ".env"))
 
-    # 3) Backend project root (backend/.env) relative to this file
-    # main.py likely at backend/eurosec_ai/main.py -> parents[1] = backend/
-    try:
-        candidates.append(Path(__file__).resolve().parents[1] / ".env")
-    except Exception:
-        pass
+    # 3) Backend project root (backend/.env)
+    candidates.append(str(_BACKEND_ROOT / ".env"))
 
     for p in candidates:
-        if p and p.exists():
+        # os.path.isfile is a single C-level stat, cheaper than Path.exists
+        if p and os.path.isfile(p):
             load_dotenv(p, override=False)
             # Optional debug (safe): shows where .env came from without printing secrets
             print(f"[dotenv] loaded from: {p}")
@@ -51,7 +58,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .logging_conf import setup_logging
-from .orchestrator.orchestrator import Orchestrator
+from .orchestrator.orchestrator import orchestrator
 from .schemas.dtos import ChatRequest, ChatResponse
 
 # ----------------------------
@@ -63,7 +70,6 @@ setup_logging()
 # App
 # ----------------------------
 app = FastAPI(title="EuroSec AI Backend", version="1.0.0")
-orchestrator = Orchestrator()
 
 # ----------------------------
 # CORS
@@ -96,6 +102,13 @@ app.add_middleware(
 # ----------------------------
 # Routes
 # ----------------------------
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    # Release the shared aiohttp session cleanly.
+    from .cloud_layer.openai_client import close_session
+    await close_session()
+
+
 @app.get("/")
 def root():
     return {
@@ -122,6 +135,6 @@ def routes():
 
 
 @app.post("/chat", response_model=ChatResponse)
-def chat(req: ChatRequest) -> ChatResponse:
-    
-    return orchestrator.process(req)
+async def chat(req: ChatRequest) -> ChatResponse:
+
+    return await orchestrator.process(req)
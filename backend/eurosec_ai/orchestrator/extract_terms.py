@@ -1,60 +1,113 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Optional
+import os
 import re
 
-# Optional spaCy (graceful if model isn't available)
+# Optional spaCy (graceful if model isn't available), loaded on first use —
+# the ~50MB en_core_web_sm load no longer happens at import time, and
+# components the extractors never read are disabled (parser stays: noun_chunks
+# needs it).
+@lru_cache(maxsize=1)
 def _load_nlp():
     try:
         import spacy
-        return spacy.load("en_core_web_sm")
+        return spacy.load("en_core_web_sm", disable=["lemmatizer", "textcat"])
     except Exception:
         return None
 
-NLP = _load_nlp()
+_SPACY_BATCH = int(os.getenv("EUROSEC_SPACY_BATCH", "64"))
 
 ROLE_REGEX = re.compile(
     r"\b(software engineer|devops|cloud engineer|data scientist|product manager|student|researcher|intern)\b",
     re.IGNORECASE,
 )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PublicTerms:
     roles: List[str]
     topics: List[str]
 
-def extract_public_terms(text: str) -> PublicTerms:
-    t = text or ""
-    roles = list({m.group(1).lower() for m in ROLE_REGEX.finditer(t)})
+def _roles(t: str) -> List[str]:
+    # dict keys dedupe in insertion order; islice caps work on pathological input
+    return list(islice(dict.fromkeys(m.group(1).lower() for m in ROLE_REGEX.finditer(t)), 5))
 
+def _topics_from_doc(doc) -> List[str]:
     topics: List[str] = []
-    if NLP is not None:
-        doc = NLP(t)
-        # Keep only non-sensitive-ish entities (very conservative)
-        for ent in doc.ents:
-            if ent.label_ in {"ORG", "PRODUCT", "EVENT", "WORK_OF_ART", "LANGUAGE"}:
-                topics.append(ent.text)
-        # Add noun chunks as "topics" candidates (short)
-        for chunk in doc.noun_chunks:
-            s = chunk.text.strip()
-            if 2 <= len(s) <= 40:
-                topics.append(s)
-    else:
-        # fallback: simple keyword-ish extraction
-        candidates = re.findall(r"\b[a-zA-Z][a-zA-Z0-9\-\_]{2,}\b", t)
-        topics.extend(candidates[:12])
-
-    # de-dupe while preserving order
-    seen = set()
-    topics_dedup = []
+    # Keep only non-sensitive-ish entities (very conservative)
+    for ent in doc.ents:
+        if ent.label_ in {"ORG", "PRODUCT", "EVENT", "WORK_OF_ART", "LANGUAGE"}:
+            topics.append(ent.text)
+    # Add noun chunks as "topics" candidates (short)
+    for chunk in doc.noun_chunks:
+        s = chunk.text.strip()
+        if 2 <= len(s) <= 40:
+            topics.append(s)
+    return topics
+
+def _topics_fallback(t: str) -> List[str]:
+    # simple keyword-ish extraction
+    return re.findall(r"\b[a-zA-Z][a-zA-Z0-9\-\_]{2,}\b", t)[:12]
+
+# Fast "NER": capitalized phrases filtered through a small stop-word set.
+# Good enough for the topic hints that go into sanitized cloud queries;
+# the full spaCy pipeline only runs when a caller asks for high accuracy.
+_PROPER_NOUN_RE = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})\b")
+_FAST_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "please", "can", "could", "would",
+    "should", "i", "my", "me", "we", "our", "you", "your", "this", "that",
+    "it", "is", "are", "make", "give", "write", "help", "also", "here",
+    "there", "what", "how", "why",
+})
+
+def _topics_fast(t: str) -> List[str]:
+    topics = [
+        m.group(1)
+        for m in _PROPER_NOUN_RE.finditer(t)
+        if m.group(1).lower() not in _FAST_STOPWORDS
+    ]
+    return topics if topics else _topics_fallback(t)
+
+def extract_public_terms_fast(text: str) -> PublicTerms:
+    t = text or ""
+    return PublicTerms(roles=_roles(t), topics=_dedup_topics(_topics_fast(t)))
+
+def _dedup_topics(topics: List[str]) -> List[str]:
+    # de-dupe while preserving order: dict insertion order replaces the
+    # seen-set bookkeeping; setdefault keeps the first casing seen
+    deduped: Dict[str, str] = {}
     for x in topics:
-        key = x.lower()
-        if key not in seen:
-            seen.add(key)
-            topics_dedup.append(x)
+        deduped.setdefault(x.lower(), x)
+    return list(islice(deduped.values(), 12))
+
+def extract_public_terms(text: str, high_accuracy: bool = False) -> PublicTerms:
+    t = text or ""
+    return PublicTerms(roles=_roles(t), topics=extract_topics(t, high_accuracy=high_accuracy))
+
+def extract_topics(text: str, high_accuracy: bool = False) -> List[str]:
+    t = text or ""
+    if high_accuracy:
+        nlp = _load_nlp()
+        if nlp is not None:
+            return _dedup_topics(_topics_from_doc(nlp(t)))
+    return _dedup_topics(_topics_fast(t))
 
-    return PublicTerms(roles=roles[:5], topics=topics_dedup[:12])
+def extract_public_terms_many(texts: List[str]) -> List[PublicTerms]:
+    """
+    Batch variant: one nlp.pipe pass over all texts (EUROSEC_SPACY_BATCH
+    controls the batch size) instead of a full pipeline run per text.
+    """
+    ts = [t or "" for t in texts]
+    nlp = _load_nlp()
+    if nlp is None:
+        return [PublicTerms(roles=_roles(t), topics=_dedup_topics(_topics_fallback(t))) for t in ts]
+    out: List[PublicTerms] = []
+    for t, doc in zip(ts, nlp.pipe(ts, batch_size=_SPACY_BATCH)):
+        out.append(PublicTerms(roles=_roles(t), topics=_dedup_topics(_topics_from_doc(doc))))
+    return out
 
 def to_dict(pt: PublicTerms) -> Dict[str, object]:
     return {"roles": pt.roles, "topics": pt.topics}
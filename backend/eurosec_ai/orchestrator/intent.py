@@ -1,43 +1,51 @@
 # backend/eurosec_ai/orchestrator/intent.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+from typing import NamedTuple
 import re
 
 
-@dataclass(frozen=True)
-class IntentResult:
+class IntentResult(NamedTuple):
     intent: str
 
 
+# fullmatch'ed, so no explicit ^/$ anchors needed
 _SMALLTALK_RE = re.compile(
-    r"^\s*(hi|hello|hey|yo|thanks|thank you|ok|okay|cool|nice|good|great|bye|goodbye)\s*[!.]*\s*$",
+    r"(hi|hello|hey|yo|thanks|thank you|ok|okay|cool|nice|good|great|bye|goodbye)\s*[!.]*\s*",
     re.IGNORECASE,
 )
 
-_SUMMARIZE_RE = re.compile(r"\b(summarize|summary|tl;dr|tldr)\b", re.IGNORECASE)
-_REWRITE_RE = re.compile(r"\b(rewrite|rephrase|improve|polish|correct)\b", re.IGNORECASE)
-_SEARCH_RE = re.compile(r"\b(find|search|locate|look for)\b", re.IGNORECASE)
-_FILE_HINT_RE = re.compile(r'file\s*:\s*".+?"|file\s*:\s*\S+|file\s*"', re.IGNORECASE)
+# One alternation, one scan: the matched group name tells us which intent
+# keyword was hit. Priority between intents is resolved after the scan (the
+# first match in the string is not necessarily the highest-priority intent).
+_INTENT_RE = re.compile(
+    r"(?P<summarize>\b(?:summarize|summary|tl;dr|tldr)\b)"
+    r"|(?P<rewrite>\b(?:rewrite|rephrase|improve|polish|correct)\b)"
+    r"|(?P<search>\b(?:find|search|locate|look for)\b)"
+    r'|(?P<file>file\s*:\s*".+?"|file\s*:\s*\S+|file\s*")',
+    re.IGNORECASE,
+)
 
 
 def classify_intent(user_text: str) -> IntentResult:
     t = (user_text or "").strip()
 
     # 1) small talk / greeting
-    if _SMALLTALK_RE.match(t):
+    if _SMALLTALK_RE.fullmatch(t):
         return IntentResult(intent="smalltalk")
 
-    # 2) summarize
-    if _SUMMARIZE_RE.search(t):
-        return IntentResult(intent="summarize")
+    # 2) single pass over the text; stop early once the top-priority intent hits
+    seen: set[str] = set()
+    for m in _INTENT_RE.finditer(t):
+        seen.add(m.lastgroup)
+        if "summarize" in seen:
+            break
 
-    # 3) rewrite/enhance
-    if _REWRITE_RE.search(t):
+    if "summarize" in seen:
+        return IntentResult(intent="summarize")
+    if "rewrite" in seen:
         return IntentResult(intent="rewrite")
-
-    # 4) explicit file/search wording
-    if _SEARCH_RE.search(t) or _FILE_HINT_RE.search(t):
+    if "search" in seen or "file" in seen:
         return IntentResult(intent="file_search")
 
     # default
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import os
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 from ..schemas.dtos import ChatRequest, ChatResponse, Evidence
 from .intent import classify_intent
-from .sensitivity import detect_sensitive
-from .extract_terms import extract_public_terms, to_dict
+from .scanner import scan
 from .sanitize import build_cloud_query
 
 from ..local_layer.pipeline import run_local_pipeline
-from ..cloud_layer.openai_client import ask_openai_sanitized
+from ..cloud_layer.openai_client import OpenAIError, ask_openai_sanitized
+from ..cloud_layer.batch_client import submit_batch, wait_for_batch
 
 
-@dataclass(frozen=True)
-class RoutePlan:
+# NamedTuple rather than a frozen dataclass: same immutability, C-implemented
+# construction — these get built per request (thousands on the batch path)
+class RoutePlan(NamedTuple):
     route: str  # "local" or "cloud"
     cloud_query: Optional[str]
 
@@ -34,6 +39,24 @@ COMMON_ROLE_WORDS = {
     "improve", "tailor", "summary", "summarize",
 }
 
+# Keep it general. No personal data. No document text.
+_ENRICHMENT_TEMPLATE = (
+    "Provide a concise, general guide for a resume rewrite for the role: "
+    "{role}. Include:\n"
+    "- 10–15 role-aligned keywords/skills\n"
+    "- 6–10 responsibilities phrased as resume bullets\n"
+    "- Common tools/tech (if applicable)\n"
+    "Do NOT ask for personal details. Keep output generic."
+)
+
+
+@lru_cache(maxsize=64)
+def _enrichment_prompt_for_role(role: str) -> str:
+    # only a handful of roles ever show up, so the formatted prompt is
+    # effectively built once per role
+    return _ENRICHMENT_TEMPLATE.format(role=role)
+
+
 def build_role_enrichment_prompt(user_text: str) -> Optional[str]:
     """
     Returns a *sanitized*, general-knowledge prompt (no doc content).
@@ -64,15 +87,7 @@ def build_role_enrichment_prompt(user_text: str) -> Optional[str]:
     if role is None:
         return None
 
-    # Keep it general. No personal data. No document text.
-    return (
-        "Provide a concise, general guide for a resume rewrite for the role: "
-        f"{role}. Include:\n"
-        "- 10–15 role-aligned keywords/skills\n"
-        "- 6–10 responsibilities phrased as resume bullets\n"
-        "- Common tools/tech (if applicable)\n"
-        "Do NOT ask for personal details. Keep output generic."
-    )
+    return _enrichment_prompt_for_role(role)
 
 
 def merge_role_knowledge_into_output(local_text: str, cloud_text: str) -> str:
@@ -93,9 +108,126 @@ def merge_role_knowledge_into_output(local_text: str, cloud_text: str) -> str:
     )
 
 
+# OpenAI throughput caps, env-tunable (defaults are conservative tier limits)
+_OPENAI_RPM = int(os.getenv("EUROSEC_OPENAI_RPM", "500"))
+_OPENAI_TPM = int(os.getenv("EUROSEC_OPENAI_TPM", "200000"))
+_OPENAI_CONCURRENCY = int(os.getenv("EUROSEC_OPENAI_CONCURRENCY", "10"))
+_CLOUD_MAX_RETRIES = 3
+
+
+def _estimate_tokens(text: str) -> int:
+    # rough chars/4 heuristic plus response headroom; close enough for budgeting
+    return max(1, len(text or "") // 4) + 500
+
+
+class _RateLimiter:
+    """Token bucket for requests/minute and tokens/minute, shared per process."""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = float(rpm)
+        self.tpm = float(tpm)
+        self.req_budget = float(rpm)
+        self.tok_budget = float(tpm)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                elapsed = now - self.updated
+                self.updated = now
+                self.req_budget = min(self.rpm, self.req_budget + self.rpm * elapsed / 60.0)
+                self.tok_budget = min(self.tpm, self.tok_budget + self.tpm * elapsed / 60.0)
+                if self.req_budget >= 1.0 and self.tok_budget >= tokens:
+                    self.req_budget -= 1.0
+                    self.tok_budget -= tokens
+                    return
+            await asyncio.sleep(0.25)
+
+
+_rate_limiter = _RateLimiter(_OPENAI_RPM, _OPENAI_TPM)
+
+
 async def _cloud_call(prompt: str) -> Optional[str]:
-    res = await ask_openai_sanitized(prompt)
-    return res.text if res else None
+    # Stay inside the RPM/TPM budget and retry rate-limit/server errors with
+    # exponential backoff; anything else propagates unchanged.
+    delay = 1.0
+    tokens = _estimate_tokens(prompt)
+    for attempt in range(_CLOUD_MAX_RETRIES + 1):
+        await _rate_limiter.acquire(tokens)
+        try:
+            res = await ask_openai_sanitized(prompt)
+            return res.text if res else None
+        except OpenAIError as e:
+            retryable = e.status == 429 or e.status >= 500
+            if not retryable or attempt >= _CLOUD_MAX_RETRIES:
+                raise
+            await asyncio.sleep(delay)
+            delay *= 2.0
+    return None
+
+
+# Enrichment answers are highly repeatable ("generic cybersecurity resume
+# keywords" ...), so completed cloud texts are cached in-process keyed on the
+# prompt hash. Failures are not cached — a retry should hit the API again.
+_CLOUD_CACHE_MAX = 256
+_cloud_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+
+async def _cloud_call_cached(prompt: str) -> Optional[str]:
+    key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+    if key in _cloud_cache:
+        _cloud_cache.move_to_end(key)
+        return _cloud_cache[key]
+    text = await _cloud_call(prompt)
+    if text is not None:
+        _cloud_cache[key] = text
+        if len(_cloud_cache) > _CLOUD_CACHE_MAX:
+            _cloud_cache.popitem(last=False)
+    return text
+
+
+# Default: run cloud enrichment concurrently with the local pipeline, so
+# latency is max(local, cloud) instead of local + cloud. Set to 1 to restore
+# the sequential order, where the cloud text is also injected into local
+# template enhancement as public_knowledge (the final merge appends it in
+# both modes).
+_SEQUENTIAL_ENRICHMENT = os.getenv("EUROSEC_SEQUENTIAL_ENRICHMENT", "0") == "1"
+
+
+# Planning is deterministic given (user_text, allow_cloud), so duplicate
+# prompts (chat retries, benchmark sweeps) reuse the computed plan instead of
+# re-running intent + scan + build_cloud_query. Keyed on a blake2b digest so
+# the LRU never hashes a long prompt twice; callers treat the cached tuple as
+# read-only.
+@lru_cache(maxsize=1024)
+def _plan_cached(
+    user_text_hash: bytes, user_text: str, allow_cloud: bool
+) -> Tuple[RoutePlan, Dict[str, object], bool, List[str], str, str]:
+    intent_res = classify_intent(user_text)
+    # One fused pass: redaction, sensitivity reasons and role terms
+    sc = scan(user_text)
+    sensitive = bool(sc.reasons)
+
+    sanitized = build_cloud_query(
+        user_text=user_text,
+        roles=sc.roles,
+        topics=sc.topics,
+        intent=intent_res.intent,
+        redacted=sc.redacted,
+    )
+
+    # Strict routing:
+    # - If sensitive OR cloud not allowed => local
+    # - Else => cloud allowed (sanitized prompt only)
+    if sensitive or not allow_cloud:
+        plan = RoutePlan(route="local", cloud_query=None)
+    else:
+        plan = RoutePlan(route="cloud", cloud_query=sanitized.cloud_query)
+
+    terms = {"roles": sc.roles, "topics": sc.topics}
+    return plan, terms, sensitive, sc.reasons, intent_res.intent, sanitized.cloud_query
 
 
 # -------------------------
@@ -114,28 +246,14 @@ class Orchestrator:
         - intent: intent classifier output
         - sanitized_cloud_query: what we'd send to cloud if needed
         """
-        intent_res = classify_intent(req.user_text)
-        sens = detect_sensitive(req.user_text)
-        terms = extract_public_terms(req.user_text)
-
-        sanitized = build_cloud_query(
-            user_text=req.user_text,
-            roles=terms.roles,
-            topics=terms.topics,
-            intent=intent_res.intent,
-        )
-
-        # Strict routing:
-        # - If sensitive OR cloud not allowed => local
-        # - Else => cloud allowed (sanitized prompt only)
-        if sens.sensitive or not req.allow_cloud:
-            plan = RoutePlan(route="local", cloud_query=None)
-        else:
-            plan = RoutePlan(route="cloud", cloud_query=sanitized.cloud_query)
-
-        return plan, to_dict(terms), sens.sensitive, sens.reasons, intent_res.intent, sanitized.cloud_query
-
-    def process(self, req: ChatRequest) -> ChatResponse:
+        key = hashlib.blake2b(
+            (req.user_text or "").encode("utf-8"), digest_size=16
+        ).digest()
+        return _plan_cached(key, req.user_text, req.allow_cloud)
+
+    async def process(
+        self, req: ChatRequest, *, precomputed_cloud: Optional[str] = None
+    ) -> ChatResponse:
         plan, extracted_terms, user_sensitive, reasons, intent, sanitized_cloud_query = self.plan(req)
 
         evidence: List[Evidence] = []
@@ -155,7 +273,7 @@ class Orchestrator:
             and intent != "summarize"
         )
 
-        # ✅ If we want enrichment, do it BEFORE local enhancement so we can inject public_knowledge
+        cloud_task: Optional[asyncio.Task] = None
         if wants_enrichment:
             enrichment_prompt = build_role_enrichment_prompt(req.user_text)
 
@@ -163,22 +281,38 @@ class Orchestrator:
             prompt_to_send = enrichment_prompt or sanitized_cloud_query
 
             if prompt_to_send:
-                cloud_text = asyncio.run(_cloud_call(prompt_to_send))
-                if cloud_text is None:
-                    evidence.append(Evidence(source="cloud", note="OPENAI_API_KEY missing; cloud skipped"))
-                    used_cloud = False
-                    cloud_text = None
+                if precomputed_cloud is not None:
+                    # Batch path already fetched this answer (process_offline)
+                    cloud_text = precomputed_cloud
                 else:
-                    used_cloud = True
-                    evidence.append(Evidence(source="cloud", note="sanitized_enrichment_used"))
+                    # ✅ Start the cloud call now so it overlaps the local pipeline below
+                    cloud_task = asyncio.create_task(_cloud_call_cached(prompt_to_send))
+
+        # Sequential mode: wait for the cloud text first so it can be injected
+        # into local template enhancement as public_knowledge
+        if cloud_task is not None and _SEQUENTIAL_ENRICHMENT:
+            cloud_text = await cloud_task
+            cloud_task = None
 
         # --- Always run local pipeline (offline) ---
-        # If we got safe cloud knowledge, inject it into template enhancement (merge remains local)
-        local_result = run_local_pipeline(
+        # In the default parallel mode the cloud call is still in flight here;
+        # its text gets appended by the merge step instead of being injected.
+        local_result = await run_local_pipeline(
             req=req,
             intent=intent,
-            public_knowledge=cloud_text,  # ✅ optional
+            public_knowledge=cloud_text,  # ✅ optional (sequential mode only)
         )
+
+        if cloud_task is not None:
+            cloud_text = await cloud_task
+
+        if wants_enrichment and (enrichment_prompt or sanitized_cloud_query):
+            if cloud_text is None:
+                evidence.append(Evidence(source="cloud", note="OPENAI_API_KEY missing; cloud skipped"))
+            else:
+                used_cloud = True
+                evidence.append(Evidence(source="cloud", note="sanitized_enrichment_used"))
+
         evidence.extend(local_result.evidence)
 
         # Final: keep local output as primary
@@ -199,3 +333,65 @@ class Orchestrator:
             evidence=evidence,
             route=("cloud" if used_cloud else plan.route),
         )
+
+    async def process_many(self, reqs: List[ChatRequest]) -> List[Union[ChatResponse, BaseException]]:
+        """
+        Process a batch of requests concurrently.
+
+        Concurrency is capped by EUROSEC_OPENAI_CONCURRENCY; cloud calls
+        additionally share the process-wide RPM/TPM budget enforced in
+        _cloud_call (with backoff on 429/5xx). A failed request comes back
+        as its exception in the result list instead of failing the batch.
+        """
+        sem = asyncio.Semaphore(max(1, _OPENAI_CONCURRENCY))
+
+        async def _one(r: ChatRequest) -> ChatResponse:
+            async with sem:
+                return await self.process(r)
+
+        return await asyncio.gather(*(_one(r) for r in reqs), return_exceptions=True)
+
+    async def process_offline(self, reqs: List[ChatRequest]) -> List[Union[ChatResponse, BaseException]]:
+        """
+        Non-interactive batch processing via the OpenAI Batch API (half token
+        cost, no RPM pressure, results within 24h).
+
+        Requests marked allow_cloud and not interactive get their sanitized
+        enrichment prompts bundled into one batch job; once it completes, each
+        request is finished through process() with its precomputed cloud text
+        (also injected into local template enhancement as public_knowledge).
+        Everything else — interactive, local-only — just goes through
+        process() with no cloud precomputation.
+        """
+        prompts: List[str] = []
+        slots: List[Optional[int]] = []
+        for req in reqs:
+            idx: Optional[int] = None
+            if req.allow_cloud and not req.interactive:
+                _plan, _terms, _sens, _reasons, intent, sanitized_cloud_query = self.plan(req)
+                if intent in {"rewrite", "improve", "tailor", "bulletize", "general_question"}:
+                    prompt = build_role_enrichment_prompt(req.user_text) or sanitized_cloud_query
+                    if prompt:
+                        idx = len(prompts)
+                        prompts.append(prompt)
+            slots.append(idx)
+
+        texts: Dict[str, str] = {}
+        if prompts:
+            batch_id = await submit_batch(prompts)
+            if batch_id:
+                texts = await wait_for_batch(batch_id)
+
+        out: List[Union[ChatResponse, BaseException]] = []
+        for req, slot in zip(reqs, slots):
+            cloud_text = texts.get(f"req-{slot}") if slot is not None else None
+            try:
+                out.append(await self.process(req, precomputed_cloud=cloud_text))
+            except Exception as e:  # mirror process_many's per-request isolation
+                out.append(e)
+        return out
+
+
+# Orchestrator is stateless, so one shared instance serves every request
+# (and every caller shares the plan/cloud caches behind it).
+orchestrator = Orchestrator()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import re
+
+# Optional: google-re2 compiles to a DFA and guarantees linear-time matching,
+# which defuses backtracking blowups (the credit-card pattern especially) on
+# adversarial inputs. Falls back to stdlib re when unavailable.
+try:
+    import re2 as _re_impl  # type: ignore
+except ImportError:
+    _re_impl = re
+
+
+def _compile(pattern: str, flags: int = 0):
+    try:
+        return _re_impl.compile(pattern, flags)
+    except Exception:
+        # re2 rejects some constructs stdlib re accepts; keep the pattern
+        return re.compile(pattern, flags)
+
+
+# Shared PII detectors, compiled once for both sanitize (substitution) and
+# sensitivity (detection) — keeping the two modules' patterns in sync.
+# Raw strings are kept alongside for callers that embed them in larger unions.
+EMAIL_PATTERN = r"\b[\w\.-]+@[\w\.-]+\.\w+\b"
+PHONE_PATTERN = r"\b(?:\+?\d{1,3}[\s-]?)?(?:\(?\d{2,4}\)?[\s-]?)?\d{3,4}[\s-]?\d{3,4}\b"
+IBAN_PATTERN = r"\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b"
+# No unbounded lazy quantifier inside the repeat (the old (?:\d[ -]*?){13,19}
+# could backtrack catastrophically on long digit/separator runs); at most one
+# separator between digits covers real card formats and keeps stdlib re linear.
+CREDITCARD_PATTERN = r"\b(?:\d[ -]?){12,18}\d\b"
+APIKEY_HINT_PATTERN = r"\b(sk-[A-Za-z0-9]{10,}|api[_-]?key|secret|token)\b"
+
+EMAIL = _compile(EMAIL_PATTERN, re.IGNORECASE)
+PHONE = _compile(PHONE_PATTERN)
+IBAN = _compile(IBAN_PATTERN)
+CREDITCARD = _compile(CREDITCARD_PATTERN)
+APIKEY_HINT = _compile(APIKEY_HINT_PATTERN, re.IGNORECASE)
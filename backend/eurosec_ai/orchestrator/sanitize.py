@@ -1,41 +1,62 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 import re
 
-EMAIL = re.compile(r"\b[\w\.-]+@[\w\.-]+\.\w+\b", re.IGNORECASE)
-PHONE = re.compile(r"\b(?:\+?\d{1,3}[\s-]?)?(?:\(?\d{2,4}\)?[\s-]?)?\d{3,4}[\s-]?\d{3,4}\b")
-IBAN = re.compile(r"\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b")
-CREDITCARD = re.compile(r"\b(?:\d[ -]*?){13,19}\b")
+from .patterns import CREDITCARD_PATTERN, EMAIL_PATTERN, IBAN_PATTERN, PHONE_PATTERN
 
-@dataclass(frozen=True)
-class Sanitized:
+class Sanitized(NamedTuple):
     sanitized_text: str
     cloud_query: Optional[str]
 
-def redact(text: str) -> str:
-    t = text or ""
-    t = EMAIL.sub("[REDACTED_EMAIL]", t)
-    t = PHONE.sub("[REDACTED_PHONE]", t)
-    t = IBAN.sub("[REDACTED_IBAN]", t)
-    t = CREDITCARD.sub("[REDACTED_CARD]", t)
-    return t
+# One fused substitution pass instead of four sequential .sub calls, each of
+# which re-scanned and re-allocated the whole string. Alternation order
+# mirrors the old substitution order (email, phone, iban, card) so
+# overlapping matches resolve the same way; (?-i:) keeps IBAN
+# case-sensitive inside the IGNORECASE union.
+_REDACT = re.compile(
+    rf"(?P<email>{EMAIL_PATTERN})"
+    rf"|(?P<phone>{PHONE_PATTERN})"
+    rf"|(?P<iban>(?-i:{IBAN_PATTERN}))"
+    rf"|(?P<card>{CREDITCARD_PATTERN})",
+    re.IGNORECASE,
+)
+
+_LABEL = {
+    "email": "[REDACTED_EMAIL]",
+    "phone": "[REDACTED_PHONE]",
+    "iban": "[REDACTED_IBAN]",
+    "card": "[REDACTED_CARD]",
+}
 
-def build_cloud_query(user_text: str, roles: list[str], topics: list[str], intent: str) -> Sanitized:
-    redacted = redact(user_text)
+def redact(text: str) -> str:
+    return _REDACT.sub(lambda m: _LABEL[m.lastgroup], text or "")
+
+# Per-intent query templates, resolved with one dict lookup instead of an
+# if/elif chain; formatting is the only per-call string work left.
+_QUERY_TEMPLATES = {
+    "email": "Write a generic professional email template for a {role} about {topics}.",
+    "rewrite": "Give general rewriting guidelines and a generic improved example for a {role} about {topics}.",
+    "summarize": "Explain how to summarize documents and provide a generic summary example about {topics}.",
+}
+_DEFAULT_QUERY_TEMPLATE = "Answer generally (no personal data) for a {role} about {topics}."
+
+def build_cloud_query(
+    user_text: str,
+    roles: list[str],
+    topics: list[str],
+    intent: str,
+    redacted: Optional[str] = None,
+) -> Sanitized:
+    # callers that already redacted (e.g. scanner.scan) pass the result in
+    if redacted is None:
+        redacted = redact(user_text)
 
     # Cloud query MUST be public/general. Do not include raw/redacted private text.
     role_hint = roles[0] if roles else "user"
     topic_hint = ", ".join(topics[:6]) if topics else "the topic"
 
-    if intent == "email":
-        q = f"Write a generic professional email template for a {role_hint} about {topic_hint}."
-    elif intent == "rewrite":
-        q = f"Give general rewriting guidelines and a generic improved example for a {role_hint} about {topic_hint}."
-    elif intent == "summarize":
-        q = f"Explain how to summarize documents and provide a generic summary example about {topic_hint}."
-    else:
-        q = f"Answer generally (no personal data) for a {role_hint} about {topic_hint}."
+    template = _QUERY_TEMPLATES.get(intent, _DEFAULT_QUERY_TEMPLATE)
+    q = template.format(role=role_hint, topics=topic_hint)
 
     return Sanitized(sanitized_text=redacted, cloud_query=q)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+import re
+
+from .extract_terms import extract_topics
+from .sensitivity import SENSITIVE_KEYWORDS
+from . import patterns
+
+
+@dataclass(frozen=True, slots=True)
+class ScanResult:
+    redacted: str
+    reasons: List[str]
+    roles: List[str]
+    topics: List[str]
+
+
+# One pass instead of four: detect_sensitive, redact and the role regex each
+# walked the full user text with their own pattern sets. This union scans it
+# once and dispatches on the matched group name. Alternation order mirrors
+# redact's old substitution order (email, phone, iban, card) so overlapping
+# matches resolve the same way. The apikey/role/keyword branches only record —
+# they never rewrite the text.
+_SCAN_RE = re.compile(
+    rf"(?P<email>{patterns.EMAIL_PATTERN})"
+    rf"|(?P<phone>{patterns.PHONE_PATTERN})"
+    rf"|(?P<iban>(?-i:{patterns.IBAN_PATTERN}))"
+    rf"|(?P<card>{patterns.CREDITCARD_PATTERN})"
+    r"|(?P<apikey>\b(?:sk-[A-Za-z0-9]{10,}|api[_-]?key|secret|token)\b)"
+    r"|(?P<role>\b(?:software engineer|devops|cloud engineer|data scientist|product manager|student|researcher|intern)\b)"
+    rf"|(?P<kw>{'|'.join(re.escape(k) for k in SENSITIVE_KEYWORDS)})",
+    re.IGNORECASE,
+)
+
+_REASON = {
+    "email": "email_detected",
+    "phone": "phone_detected",
+    "iban": "iban_detected",
+    "card": "card_number_like_detected",
+    "apikey": "secret_or_key_hint_detected",
+}
+
+_LABEL = {
+    "email": "[REDACTED_EMAIL]",
+    "phone": "[REDACTED_PHONE]",
+    "iban": "[REDACTED_IBAN]",
+    "card": "[REDACTED_CARD]",
+}
+
+
+def scan(text: str) -> ScanResult:
+    """
+    Single fused pass over the user text producing the redacted form, the
+    sensitivity reasons, and the detected role terms. Topic extraction still
+    runs separately (it needs spaCy noun chunks when available).
+    """
+    t = text or ""
+    parts: List[str] = []
+    last = 0
+    reasons: List[str] = []
+    seen_reasons: set[str] = set()
+    roles_seen: dict[str, None] = {}
+
+    for m in _SCAN_RE.finditer(t):
+        g = m.lastgroup
+        label = _LABEL.get(g)
+        if label:
+            parts.append(t[last:m.start()])
+            parts.append(label)
+            last = m.end()
+        if g == "role":
+            roles_seen.setdefault(m.group(0).lower())
+        else:
+            # keyword reasons carry the matched word, mirroring detect_sensitive
+            if g == "kw":
+                reason = f"sensitive_keyword:{m.group(0).lower()}"
+            else:
+                reason = _REASON[g]
+            if reason not in seen_reasons:
+                seen_reasons.add(reason)
+                reasons.append(reason)
+
+    # The phone branch can consume the digits of a card number before the
+    # card branch sees them (same way redact's substitution order behaves);
+    # detect_sensitive still reported both, so recheck that one shadowing case.
+    if "phone_detected" in seen_reasons and "card_number_like_detected" not in seen_reasons:
+        if patterns.CREDITCARD.search(t):
+            reasons.append("card_number_like_detected")
+
+    if parts:
+        parts.append(t[last:])
+        redacted = "".join(parts)
+    else:
+        redacted = t
+
+    return ScanResult(
+        redacted=redacted,
+        reasons=reasons,
+        roles=list(roles_seen)[:5],
+        topics=extract_topics(t),
+    )
@@ -1,21 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
+
+# Practical GDPR-ish detectors (heuristic, extend later) — shared with sanitize
+from .patterns import APIKEY_HINT, CREDITCARD, EMAIL, IBAN, PHONE
 import re
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SensitivityResult:
     sensitive: bool
     reasons: List[str]
 
-# Practical GDPR-ish detectors (heuristic, extend later)
-EMAIL = re.compile(r"\b[\w\.-]+@[\w\.-]+\.\w+\b", re.IGNORECASE)
-PHONE = re.compile(r"\b(?:\+?\d{1,3}[\s-]?)?(?:\(?\d{2,4}\)?[\s-]?)?\d{3,4}[\s-]?\d{3,4}\b")
-IBAN = re.compile(r"\b[A-Z]{2}\d{2}[A-Z0-9]{11,30}\b")
-CREDITCARD = re.compile(r"\b(?:\d[ -]*?){13,19}\b")
-APIKEY_HINT = re.compile(r"\b(sk-[A-Za-z0-9]{10,}|api[_-]?key|secret|token)\b", re.IGNORECASE)
-
 SENSITIVE_KEYWORDS = [
     "passport", "visa", "aadhar", "ssn", "social security",
     "bank", "iban", "credit card", "salary slip",
@@ -23,23 +19,72 @@ SENSITIVE_KEYWORDS = [
     "address", "private", "confidential",
 ]
 
+# Keyword scan: an Aho–Corasick automaton finds any keyword in one
+# O(len(text)) pass instead of one substring search per keyword, which
+# matters as the list grows. Optional — falls back to the linear scan when
+# pyahocorasick isn't installed.
+try:
+    import ahocorasick  # type: ignore
+
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _k in SENSITIVE_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_k.lower(), _k)
+    _KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    _KEYWORD_AUTOMATON = None
+
+# Case-insensitive fallback matcher, so the common path never builds a
+# lowercased copy of the whole text just for the keyword check.
+_KEYWORDS_RE = re.compile("|".join(map(re.escape, SENSITIVE_KEYWORDS)), re.IGNORECASE)
+
+
+def _first_keyword(t: str) -> Optional[str]:
+    if _KEYWORD_AUTOMATON is not None:
+        # pyahocorasick has no case-insensitive mode; the copy is confined
+        # to this optional branch
+        for _end, kw in _KEYWORD_AUTOMATON.iter(t.lower()):
+            return kw
+        return None
+    m = _KEYWORDS_RE.search(t)
+    return m.group(0).lower() if m else None
+
+# Ordered checks shared by the audit path (all of them) and the fast path
+# (first hit wins)
+_CHECKS = (
+    (EMAIL, "email_detected"),
+    (PHONE, "phone_detected"),
+    (IBAN, "iban_detected"),
+    (CREDITCARD, "card_number_like_detected"),
+    (APIKEY_HINT, "secret_or_key_hint_detected"),
+)
+
+
 def detect_sensitive(text: str) -> SensitivityResult:
     t = text or ""
-    low = t.lower()
     reasons: List[str] = []
 
-    if EMAIL.search(t):
-        reasons.append("email_detected")
-    if PHONE.search(t):
-        reasons.append("phone_detected")
-    if IBAN.search(t):
-        reasons.append("iban_detected")
-    if CREDITCARD.search(t):
-        reasons.append("card_number_like_detected")
-    if APIKEY_HINT.search(t):
-        reasons.append("secret_or_key_hint_detected")
+    for pat, reason in _CHECKS:
+        if pat.search(t):
+            reasons.append(reason)
 
-    if any(k in low for k in SENSITIVE_KEYWORDS):
-        reasons.append("sensitive_keyword")
+    kw = _first_keyword(t)
+    if kw is not None:
+        # keep the matched keyword for reasons granularity (free: the scan
+        # already knows which word fired)
+        reasons.append(f"sensitive_keyword:{kw}")
 
     return SensitivityResult(sensitive=len(reasons) > 0, reasons=reasons)
+
+
+def is_sensitive_fast(text: str) -> Optional[str]:
+    """
+    First matching reason, stopping at the first hit — for callers that only
+    need the routing decision. detect_sensitive stays as the verbose audit
+    path that reports every reason.
+    """
+    t = text or ""
+    for pat, reason in _CHECKS:
+        if pat.search(t):
+            return reason
+    kw = _first_keyword(t)
+    return f"sensitive_keyword:{kw}" if kw is not None else None
@@ -1,20 +1,33 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared model_config: unknown fields are dropped instead of validated, and
+# instances are frozen — nothing mutates a DTO after construction, and frozen
+# models skip the per-field mutability machinery.
+_DTO_CONFIG = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=False)
 
 class Evidence(BaseModel):
+    model_config = _DTO_CONFIG
+
     source: str
     path: Optional[str] = None
     note: Optional[str] = None
 
 class ChatRequest(BaseModel):
+    model_config = _DTO_CONFIG
+
     user_text: str = Field(..., min_length=1)
     allow_cloud: bool = False
+    # False marks batch/offline work that can take the cheaper Batch API path
+    interactive: bool = True
     workspace_dirs: List[str] = []
     preferred_files: List[str] = []
 
 class ChatResponse(BaseModel):
+    model_config = _DTO_CONFIG
+
     final_text: str
     used_cloud: bool
     sensitive_detected: bool